@@ -4,127 +4,178 @@ Interactive X.com (Twitter) Scraper with Rich Terminal UI
 Provides an interactive menu to configure and run tweet scraping.
 """
 
-import json
 import sys
-import asyncio
+import re
 import shlex
+import functools
 from datetime import datetime, timedelta
-from twitter_search_scraper import scrape_search_results
 
 try:
     from rich.console import Console
     from rich.prompt import Prompt, Confirm
     from rich.panel import Panel
     from rich.text import Text
-    from rich.table import Table
+    from rich.console import Group
+    from rich.markup import escape
 except ImportError:
     print("Error: 'rich' library is required. Install it with: pip install rich")
     sys.exit(1)
 
-console = Console()
+class BufferedConsole(Console):
+    """Console that collects output fragments and emits them with a single print call."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._line_buffer = []
+
+    def write(self, text):
+        """Append a fragment to the pending output without printing it."""
+        self._line_buffer.append(text)
+
+    def writeln(self, text=""):
+        """Append a fragment and flush all pending output with one print call."""
+        self._line_buffer.append(text)
+        output = "".join(self._line_buffer)
+        self._line_buffer.clear()
+        super().print(output)
+
+console = BufferedConsole()
+
+def build_menu(title, options):
+    """Build a numbered menu as a single Text renderable."""
+    menu = Text()
+    menu.append(f"\n{title}\n", style="bold cyan")
+    menu.append("\n".join(f"{number}. {option}" for number, option in enumerate(options, 1)))
+    return menu
+
+# Static menus, built once at import and reused on every prompt
+_SEARCH_TYPE_MENU = build_menu("Select Search Type:", ["Keyword search (single or multiple)", "Account-based search"])
+_KEYWORD_MODE_MENU = build_menu("Keyword Mode:", ["Single keyword", "Multiple keywords (OR logic)"])
+_DATE_RANGE_HELP = Text.assemble(
+    ("\nDate Range:\n", "bold cyan"),
+    "Enter dates in YYYY-MM-DD format (or press Enter for today/yesterday)"
+)
+
+# Output formats offered by the menu: (choice, extension, accepted filename suffixes)
+_OUTPUT_FORMATS = (("1", "json", (".json",)), ("2", "xlsx", (".xlsx", ".xls")))
+_OUTPUT_FORMAT_MENU = build_menu("Output Format:", ["JSON (.json)", "Excel (.xlsx)"])
+
+# Date formats accepted for user-entered dates, tried in order
+_DATE_FORMATS = ('%Y-%m-%d', '%Y/%m/%d', '%m/%d/%Y', '%d/%m/%Y')
+
+# Keyword with surrounding whitespace and a leading @ removed (same as strip().lstrip('@').strip())
+_KW_STRIP_RE = re.compile(r'^\s*@*\s*(.*?)\s*$', re.DOTALL)
 
+# Arguments made only of these characters can be pasted into a shell without quoting
+_SHELL_SAFE_RE = re.compile(r'[\w\-./:]+')
+
+@functools.lru_cache(maxsize=128)
 def format_date(date_str):
     """Format date string to YYYY-MM-DD if needed."""
-    try:
-        # Try parsing various formats
-        for fmt in ['%Y-%m-%d', '%Y/%m/%d', '%m/%d/%Y', '%d/%m/%Y']:
-            try:
-                dt = datetime.strptime(date_str, fmt)
-                return dt.strftime('%Y-%m-%d')
-            except ValueError:
-                continue
-        # If no format matches, return as is (might be invalid)
-        return date_str
-    except:
+    # Already normalized (e.g. the prompt defaults) - nothing to convert
+    if len(date_str) == 10 and date_str[4] == '-':
         return date_str
+    # Try parsing various formats
+    for fmt in _DATE_FORMATS:
+        try:
+            dt = datetime.strptime(date_str, fmt)
+            return dt.strftime('%Y-%m-%d')
+        except ValueError:
+            continue
+    # If no format matches, return as is (might be invalid)
+    return date_str
 
 def get_search_type():
     """Ask user for search type."""
-    console.print("\n[bold cyan]Select Search Type:[/bold cyan]")
-    console.print("1. Keyword search (single or multiple)")
-    console.print("2. Account-based search")
+    console.print(_SEARCH_TYPE_MENU)
     
     choice = Prompt.ask("Enter choice", choices=["1", "2"], default="1")
     return choice
 
 def get_keyword_mode():
     """Ask if user wants single or multiple keywords."""
-    console.print("\n[bold cyan]Keyword Mode:[/bold cyan]")
-    console.print("1. Single keyword")
-    console.print("2. Multiple keywords (OR logic)")
+    console.print(_KEYWORD_MODE_MENU)
     
     choice = Prompt.ask("Enter choice", choices=["1", "2"], default="1")
     return choice
 
+def extract_exclusions(keyword_str):
+    """Extract account exclusions from keyword(s)."""
+    exclusions = []
+    kw_clean = _KW_STRIP_RE.match(keyword_str).group(1)
+    if kw_clean:
+        exclusions.append(kw_clean.lower())
+        if kw_clean.lower() != kw_clean:
+            exclusions.append(kw_clean)
+    return exclusions
+
+def build_or_query(keywords):
+    """Build an OR query from a list of keywords: (keyword1) OR (keyword2) OR (keyword3)."""
+    return "(" + ") OR (".join(keywords) + ")" if keywords else ""
+
+def read_keywords():
+    """
+    Read keywords until an empty entry.
+    Piped (non-TTY) input is read line by line without going through Rich prompts.
+    """
+    interactive = sys.stdin.isatty()
+    keywords = []
+    number = 1
+    while True:
+        if interactive:
+            kw = Prompt.ask(f"Keyword {number}", default="")
+        else:
+            line = sys.stdin.readline()
+            if not line and not keywords:
+                raise EOFError("Input ended before any keyword was entered")
+            kw = line.strip()
+        if not kw:
+            return keywords
+        keywords.append(kw)
+        number += 1
+
 def get_keywords():
     """Get keywords from user."""
     mode = get_keyword_mode()
     
-    def extract_exclusions(keyword_str):
-        """Extract account exclusions from keyword(s)."""
-        exclusions = []
-        kw_clean = keyword_str.strip().lstrip('@').strip()
-        if kw_clean:
-            exclusions.append(kw_clean.lower())
-            if kw_clean.lower() != kw_clean:
-                exclusions.append(kw_clean)
-        return exclusions
-    
     if mode == "1":
         keyword = Prompt.ask("\n[bold]Enter keyword or hashtag[/bold]")
         # Extract account exclusions for single keyword
         exclusions = extract_exclusions(keyword)
         if exclusions:
-            # Remove duplicates
-            seen = set()
-            unique_exclusions = []
-            for exc in exclusions:
-                if exc.lower() not in seen:
-                    seen.add(exc.lower())
-                    unique_exclusions.append(exc)
+            # Remove duplicates (case-insensitive, the lowercase variant always comes first)
+            unique_exclusions = list(dict.fromkeys(exc.lower() for exc in exclusions))
             
-            exclusion_str = " ".join(f"-@{acc}" for acc in unique_exclusions)
+            exclusion_str = "-@" + " -@".join(unique_exclusions)
             full_query = f"{keyword} {exclusion_str}"
-            console.print(f"\n[green]Query will be: {full_query}[/green]")
-            console.print(f"[dim]Note: Automatically excluding accounts: {', '.join(unique_exclusions)}[/dim]")
+            console.write(f"\n[green]Query will be: {full_query}[/green]\n")
+            console.writeln(f"[dim]Note: Automatically excluding accounts: {', '.join(unique_exclusions)}[/dim]")
         else:
             console.print(f"\n[green]Query will be: {keyword}[/green]")
         return keyword
     else:
-        console.print("\n[bold]Enter multiple keywords (press Enter after each, empty to finish):[/bold]")
         keywords = []
-        while True:
-            kw = Prompt.ask(f"Keyword {len(keywords) + 1}", default="")
-            if not kw:
-                break
-            keywords.append(kw)
-        
-        if not keywords:
-            console.print("[red]Error: At least one keyword is required![/red]")
-            return get_keywords()
+        # Re-ask for keywords (not the mode) until at least one is entered
+        while not keywords:
+            console.print("\n[bold]Enter multiple keywords (press Enter after each, empty to finish):[/bold]")
+            keywords = read_keywords()
+            
+            if not keywords:
+                console.print("[red]Error: At least one keyword is required![/red]")
         
-        # Build OR query: (keyword1 OR keyword2 OR keyword3)
-        or_query = " OR ".join(f"({kw})" for kw in keywords)
+        or_query = build_or_query(keywords)
         
         # Extract account exclusions (lowercase and original case variants)
-        exclusions = []
-        for kw in keywords:
-            kw_exclusions = extract_exclusions(kw)
-            exclusions.extend(kw_exclusions)
+        exclusions = [exc for kw in keywords for exc in extract_exclusions(kw)]
         
-        # Remove duplicates
-        seen = set()
-        unique_exclusions = []
-        for exc in exclusions:
-            if exc.lower() not in seen:
-                seen.add(exc.lower())
-                unique_exclusions.append(exc)
+        # Remove duplicates (case-insensitive, the lowercase variant always comes first)
+        unique_exclusions = list(dict.fromkeys(exc.lower() for exc in exclusions))
         
         if unique_exclusions:
-            exclusion_str = " ".join(f"-@{acc}" for acc in unique_exclusions)
+            exclusion_str = "-@" + " -@".join(unique_exclusions)
             full_query = f"{or_query} {exclusion_str}"
-            console.print(f"\n[green]Query will be: {full_query}[/green]")
-            console.print(f"[dim]Note: Automatically excluding accounts: {', '.join(unique_exclusions)}[/dim]")
+            console.write(f"\n[green]Query will be: {full_query}[/green]\n")
+            console.writeln(f"[dim]Note: Automatically excluding accounts: {', '.join(unique_exclusions)}[/dim]")
         else:
             console.print(f"\n[green]Query will be: {or_query}[/green]")
         
@@ -135,26 +186,25 @@ def get_account():
     account = Prompt.ask("\n[bold]Enter account username[/bold] (without @)")
     return account.lstrip('@')
 
-def get_date_range():
-    """Ask user for date range."""
+def get_date_range(now):
+    """Ask user for date range, defaulting relative to the session time `now`."""
     use_dates = Confirm.ask("\n[bold]Do you want to filter by date range?[/bold]", default=False)
     
     if not use_dates:
         return None, None
     
-    console.print("\n[bold cyan]Date Range:[/bold cyan]")
-    console.print("Enter dates in YYYY-MM-DD format (or press Enter for today/yesterday)")
+    console.print(_DATE_RANGE_HELP)
     
     since_date = Prompt.ask("Start date (since)", default="")
     until_date = Prompt.ask("End date (until)", default="")
     
     # Default to today if not provided
     if not until_date:
-        until_date = datetime.now().strftime('%Y-%m-%d')
+        until_date = now.strftime('%Y-%m-%d')
     
     # Default to yesterday if not provided
     if not since_date:
-        since_date = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+        since_date = (now - timedelta(days=1)).strftime('%Y-%m-%d')
     
     since_date = format_date(since_date)
     until_date = format_date(until_date)
@@ -177,94 +227,66 @@ def get_limit():
 
 def get_output_format():
     """Ask user for output format."""
-    console.print("\n[bold cyan]Output Format:[/bold cyan]")
-    console.print("1. JSON (.json)")
-    console.print("2. Excel (.xlsx)")
+    console.print(_OUTPUT_FORMAT_MENU)
     
-    choice = Prompt.ask("Enter choice", choices=["1", "2"], default="1")
+    choice = Prompt.ask("Enter choice", choices=[choice for choice, _, _ in _OUTPUT_FORMATS], default="1")
     return choice
 
-def get_output_file():
-    """Get output filename from user."""
+def get_output_file(now):
+    """Get output filename from user, timestamping the default with the session time `now`."""
     format_choice = get_output_format()
+    _, extension, suffixes = next(fmt for fmt in _OUTPUT_FORMATS if fmt[0] == format_choice)
     
-    if format_choice == "2":
-        default_file = f"scraped_tweets_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-        output = Prompt.ask("\n[bold]Output filename[/bold]", default=default_file)
-        if not output.endswith('.xlsx') and not output.endswith('.xls'):
-            output += '.xlsx'
-    else:
-        default_file = f"scraped_tweets_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        output = Prompt.ask("\n[bold]Output filename[/bold]", default=default_file)
-        if not output.endswith('.json'):
-            output += '.json'
+    default_file = f"scraped_tweets_{now.strftime('%Y%m%d_%H%M%S')}.{extension}"
+    output = Prompt.ask("\n[bold]Output filename[/bold]", default=default_file)
+    if not output.endswith(suffixes):
+        output += f'.{extension}'
     
     return output
 
+def shell_arg(value):
+    """Quote a value for the shell only if it contains characters that need it."""
+    value = str(value)
+    return value if _SHELL_SAFE_RE.fullmatch(value) else shlex.quote(value)
+
 def generate_command(search_type, keyword, account, since_date, until_date, latest, limit, output):
     """Generate the command string that can be run directly."""
-    cmd_parts = ["python", "run_search_scraper.py"]
-    
-    if search_type == "1":
-        # Keyword search
-        cmd_parts.append(f'--keyword')
-        # Properly escape the keyword for shell
-        cmd_parts.append(shlex.quote(keyword))
-    else:
-        # Account search
-        cmd_parts.append(f'--from-account')
-        cmd_parts.append(shlex.quote(account))
-    
-    # Add limit
-    cmd_parts.append(f'--limit')
-    cmd_parts.append(str(limit))
-    
-    # Add latest flag if enabled
-    if latest:
-        cmd_parts.append('--latest')
-    
-    # Add date filters if provided
-    if since_date:
-        cmd_parts.append(f'--since-date')
-        cmd_parts.append(shlex.quote(since_date))
-    
-    if until_date:
-        cmd_parts.append(f'--until-date')
-        cmd_parts.append(shlex.quote(until_date))
-    
-    # Add output file
-    cmd_parts.append(f'--output')
-    cmd_parts.append(shlex.quote(output))
-    
-    return " ".join(cmd_parts)
+    # Keyword, account and output are free-form user input and are always quoted
+    target = f"--keyword {shlex.quote(keyword)}" if search_type == "1" else f"--from-account {shlex.quote(account)}"
+    return (
+        f"python run_search_scraper.py {target} --limit {shell_arg(limit)}"
+        f"{' --latest' if latest else ''}"
+        f"{f' --since-date {shell_arg(since_date)}' if since_date else ''}"
+        f"{f' --until-date {shell_arg(until_date)}' if until_date else ''}"
+        f" --output {shlex.quote(output)}"
+    )
 
 def display_summary(search_type, keyword, account, since_date, until_date, latest, limit, output):
     """Display a summary of the scraping configuration."""
+    from rich.table import Table
+    
     table = Table(title="Scraping Configuration", show_header=True, header_style="bold magenta")
     table.add_column("Setting", style="cyan")
     table.add_column("Value", style="green")
     
     if search_type == "1":
-        table.add_row("Search Type", "Keyword")
-        table.add_row("Keyword(s)", keyword)
+        search_rows = [("Search Type", "Keyword"), ("Keyword(s)", keyword)]
     else:
-        table.add_row("Search Type", "Account")
-        table.add_row("Account", f"@{account}")
+        search_rows = [("Search Type", "Account"), ("Account", f"@{account}")]
     
-    if since_date and until_date:
-        table.add_row("Date Range", f"{since_date} to {until_date}")
-    else:
-        table.add_row("Date Range", "Not specified")
+    rows = search_rows + [
+        ("Date Range", f"{since_date} to {until_date}" if since_date and until_date else "Not specified"),
+        ("Latest Mode", "Yes" if latest else "No"),
+        ("Limit", str(limit)),
+        ("Output Format", "Excel (.xlsx)" if output.endswith(('.xlsx', '.xls')) else "JSON (.json)"),
+        ("Output File", output),
+    ]
     
-    table.add_row("Latest Mode", "Yes" if latest else "No")
-    table.add_row("Limit", str(limit))
-    output_format = "Excel (.xlsx)" if output.endswith('.xlsx') or output.endswith('.xls') else "JSON (.json)"
-    table.add_row("Output Format", output_format)
-    table.add_row("Output File", output)
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row)
     
-    console.print("\n")
-    console.print(table)
-    console.print()
+    console.print(Group(Text(), table, Text()))
     
     # Note: Command will be displayed separately in main() for better visibility
 
@@ -273,7 +295,11 @@ def run_scraper(keyword, account, since_date, until_date, latest, limit, output)
     console.print("\n[bold yellow]Starting scraper...[/bold yellow]\n")
     
     try:
-        collected_tweets = asyncio.run(scrape_search_results(
+        # Imported here because the scraper pulls in playwright and pandas, which
+        # would otherwise delay the interactive menu on startup
+        from twitter_search_scraper import scrape_search_results, run_async
+        
+        collected_tweets = run_async(scrape_search_results(
             keyword=keyword,
             from_account=account,
             username=None,
@@ -286,8 +312,8 @@ def run_scraper(keyword, account, since_date, until_date, latest, limit, output)
             output_file=output
         ))
         
-        console.print(f"\n[bold green]✓ Scraping finished![/bold green]")
-        console.print(f"[green]Collected {len(collected_tweets)} tweets saved to {output}[/green]")
+        console.write("\n[bold green]✓ Scraping finished![/bold green]\n")
+        console.writeln(f"[green]Collected {len(collected_tweets)} new tweets, saved to {output}[/green]")
         return True
         
     except Exception as e:
@@ -302,6 +328,9 @@ def main():
         border_style="cyan"
     ))
     
+    # Single timestamp for all defaults in this session
+    now = datetime.now()
+    
     # Get search type
     search_type = get_search_type()
     
@@ -314,7 +343,7 @@ def main():
         account = get_account()
     
     # Get date range
-    since_date, until_date = get_date_range()
+    since_date, until_date = get_date_range(now)
     
     # Get latest mode
     latest = get_latest_mode()
@@ -323,29 +352,32 @@ def main():
     limit = get_limit()
     
     # Get output file
-    output = get_output_file()
+    output = get_output_file(now)
     
-    # Generate command first
+    # Generate command first (rendered as plain Text so it is never parsed as markup)
     command = generate_command(search_type, keyword, account, since_date, until_date, latest, limit, output)
+    command_text = Text(command, style="bold bright_yellow")
     
     # Display summary
     display_summary(search_type, keyword, account, since_date, until_date, latest, limit, output)
     
     # Display command prominently before running
-    console.print("\n")
-    console.print(Panel(
-        f"[bold bright_yellow]{command}[/bold bright_yellow]",
-        title="[bold bright_cyan]📋 Command to run directly (copy this):[/bold bright_cyan]",
-        border_style="bright_yellow",
-        padding=(1, 2)
+    console.print(Group(
+        Text(),
+        Panel(
+            command_text,
+            title="[bold bright_cyan]📋 Command to run directly (copy this):[/bold bright_cyan]",
+            border_style="bright_yellow",
+            padding=(1, 2)
+        ),
+        Text()
     ))
-    console.print()
     
     # Confirm before running
     if not Confirm.ask("[bold]Start scraping?[/bold]", default=True):
-        console.print("[yellow]Cancelled by user.[/yellow]")
-        console.print(f"\n[bold]You can run the command manually:[/bold]")
-        console.print(f"[bright_yellow]{command}[/bright_yellow]")
+        console.write("[yellow]Cancelled by user.[/yellow]\n")
+        console.write("\n[bold]You can run the command manually:[/bold]\n")
+        console.writeln(f"[bright_yellow]{escape(command)}[/bright_yellow]")
         return
     
     # Run scraper
@@ -357,15 +389,17 @@ def main():
         console.print("\n[bold red]✗ Scraping failed. Check the error messages above.[/bold red]")
     
     # Display command again prominently after scraping for easy copying
-    console.print("\n")
-    console.print(Panel(
-        f"[bold bright_yellow]{command}[/bold bright_yellow]",
-        title="[bold bright_cyan]📋 Command used (copy for future use):[/bold bright_cyan]",
-        border_style="bright_yellow",
-        padding=(1, 2)
+    console.print(Group(
+        Text(),
+        Panel(
+            command_text,
+            title="[bold bright_cyan]📋 Command used (copy for future use):[/bold bright_cyan]",
+            border_style="bright_yellow",
+            padding=(1, 2)
+        ),
+        Text("Tip: You can copy and paste this command to run the scraper again with the same settings.", style="dim"),
+        Text()
     ))
-    console.print(f"[dim]Tip: You can copy and paste this command to run the scraper again with the same settings.[/dim]")
-    console.print()
 
 if __name__ == "__main__":
     try:
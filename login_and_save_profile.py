@@ -4,11 +4,48 @@ You will login manually, then press Enter to save the browser profile.
 """
 import asyncio
 import os
+import sys
 from playwright.async_api import async_playwright
 
+# Try to import uvloop for a faster event loop (not supported on Windows)
+try:
+    import uvloop
+    UVLOOP_SUPPORT = sys.platform != 'win32'
+except ImportError:
+    UVLOOP_SUPPORT = False
+
 # Define the path for the browser profile directory
 BROWSER_PROFILE_PATH = "browser_profile"
 
+# Anti-detection script registered on the browser context
+STEALTH_SCRIPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stealth_init.js")
+
+# Console text, each block written with a single write call
+SEPARATOR = "=" * 60
+
+SETUP_BANNER = f"""{SEPARATOR}
+X.com Browser Profile Setup
+{SEPARATOR}
+
+This script will:
+1. Open a browser window
+2. Navigate to x.com login page
+3. Wait for you to login manually
+4. Save the browser profile when you press Enter
+
+"""
+
+LOGIN_INSTRUCTIONS = f"""
+{SEPARATOR}
+Browser is now open. Please login manually:
+1. Complete the login process in the browser
+2. Handle any CAPTCHA or verification if needed
+3. Make sure you're logged in and can see your home feed
+4. Once logged in, come back here and press ENTER
+{SEPARATOR}
+
+"""
+
 async def open_browser_and_wait_for_login():
     """
     Opens browser with persistent context and waits for user to manually login.
@@ -41,6 +78,9 @@ async def open_browser_and_wait_for_login():
                 ]
             )
             
+            # Register the anti-detection script once on the context so it applies to every page
+            await browser.add_init_script(path=STEALTH_SCRIPT_PATH)
+            
             # Get the first page (persistent context creates a page automatically)
             pages = browser.pages
             if pages:
@@ -48,35 +88,17 @@ async def open_browser_and_wait_for_login():
             else:
                 page = await browser.new_page()
             
-            # Remove webdriver property to avoid detection
-            await page.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-                // Override the plugins property to use a custom getter
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5]
-                });
-                // Override the languages property to use a custom getter
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['en-US', 'en']
-                });
-            """)
-            
             # Navigate to login page
             print("Navigating to x.com login page...")
             await page.goto("https://x.com/i/flow/login", timeout=60000, wait_until='domcontentloaded')
-            await asyncio.sleep(2)  # Wait a bit for page to fully load
+            # Wait for the login page to settle, but don't block longer than needed
+            try:
+                await page.wait_for_load_state('networkidle', timeout=5000)
+            except Exception:
+                pass  # X.com keeps some connections open; continue once the page is usable
             
-            print()
-            print("=" * 60)
-            print("Browser is now open. Please login manually:")
-            print("1. Complete the login process in the browser")
-            print("2. Handle any CAPTCHA or verification if needed")
-            print("3. Make sure you're logged in and can see your home feed")
-            print("4. Once logged in, come back here and press ENTER")
-            print("=" * 60)
-            print()
+            sys.stdout.write(LOGIN_INSTRUCTIONS)
+            sys.stdout.flush()
             
             # Wait for user to press Enter
             input("Press ENTER after you have successfully logged in...")
@@ -85,7 +107,6 @@ async def open_browser_and_wait_for_login():
             print("\nVerifying login...")
             try:
                 await page.goto("https://x.com/home", timeout=60000)
-                await asyncio.sleep(2)
                 await page.wait_for_selector('[data-testid="primaryColumn"]', timeout=10000)
                 print("✓ Login verified! Profile will be saved automatically.")
             except Exception as e:
@@ -106,28 +127,32 @@ async def open_browser_and_wait_for_login():
 
 async def main():
     """Main function to run the login script."""
-    print("=" * 60)
-    print("X.com Browser Profile Setup")
-    print("=" * 60)
-    print()
-    print("This script will:")
-    print("1. Open a browser window")
-    print("2. Navigate to x.com login page")
-    print("3. Wait for you to login manually")
-    print("4. Save the browser profile when you press Enter")
-    print()
+    sys.stdout.write(SETUP_BANNER)
+    sys.stdout.flush()
     
     input("Press ENTER to start...")
     print()
     
     await open_browser_and_wait_for_login()
     
-    print()
-    print("=" * 60)
-    print("✓ Profile setup complete!")
-    print("=" * 60)
-    print(f"Your browser profile is saved at: {os.path.abspath(BROWSER_PROFILE_PATH)}")
-    print("You can now run the scraper without logging in again.")
+    sys.stdout.write(f"""
+{SEPARATOR}
+✓ Profile setup complete!
+{SEPARATOR}
+Your browser profile is saved at: {os.path.abspath(BROWSER_PROFILE_PATH)}
+You can now run the scraper without logging in again.
+""")
+    sys.stdout.flush()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Run on uvloop when available, without importing the whole scraper module for it
+    if UVLOOP_SUPPORT:
+        loop = uvloop.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(main())
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+    else:
+        asyncio.run(main())
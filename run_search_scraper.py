@@ -1,116 +1,214 @@
-import json
 import sys
+import signal
 import asyncio
-import argparse
+import itertools
+import functools
+import dataclasses
+import pathlib
 from datetime import date, timedelta
-from twitter_search_scraper import scrape_search_results
+from twitter_search_scraper import scrape_search_results, browser_session, run_async
 
 
-def get_month_date_range():
-    today = date.today()
+@functools.lru_cache(maxsize=1)
+def _month_date_range_for(ordinal):
+    today = date.fromordinal(ordinal)
     since_date = today.replace(day=1).isoformat()
     until_date = (today + timedelta(days=1)).isoformat()
     return since_date, until_date
 
 
-def load_lines_from_file(path):
-    with open(path, "r", encoding="utf-8") as f:
-        return [line.strip() for line in f if line.strip()]
+@dataclasses.dataclass(frozen=True)
+class ScrapeConfig:
+    """Options shared by every scrape in one CLI run."""
+    username: str
+    password: str
+    email: str
+    since_date: str
+    until_date: str
+    limit: int
+    latest: bool
+    output_file: str
+    fetch_followers: bool
 
 
-def tag_and_reorder_tweets(tweets, search_value):
-    tagged = []
-    for tweet in tweets:
-        new_tweet = {"search_value": search_value}
-        new_tweet.update(tweet)
-        tagged.append(new_tweet)
-    return tagged
+def get_month_date_range():
+    return _month_date_range_for(date.today().toordinal())
 
 
-def run_search_from_args(args):
-    limit = args.limit
-    output_file = args.output or "scraped_search_tweets.xlsx"
-    username = args.username
-    password = args.password
-    email = args.email
+def open_lines_file(path):
+    """Open a keywords/profiles file, exiting with an error message if it can't be opened."""
+    try:
+        return open(path, "r", encoding="utf-8")
+    except OSError as e:
+        print(f"Error: Could not open {path}: {e.strerror}")
+        sys.exit(1)
 
-    since_date, until_date = get_month_date_range()
 
-    keyword_queries = []
-    profiles = []
+def iter_lines_from_file(f):
+    """Yield the non-empty, stripped lines of an open file, closing it when done."""
+    with f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield line
+
+
+def iter_unique(values):
+    """
+    Yield values in order, skipping case-insensitive repeats.
+    X search terms and handles are case-insensitive, so repeats would only
+    scrape the same results again.
+    """
+    seen = set()
+    for value in values:
+        key = value.casefold()
+        if key not in seen:
+            seen.add(key)
+            yield value
+
+
+# Output file used when --output is not given
+OUTPUT_DEFAULT = "scraped_search_tweets.xlsx"
+
+# All scrapes share one browser session but still rewrite the same output
+# file, so only one scrape may run at a time
+MAX_CONCURRENT_SCRAPES = 1
+
+
+async def _scrape_one(semaphore, scrape, header, query):
+    async with semaphore:
+        sys.stdout.write(header)
+        return await scrape(**query)
+
+
+def _cancel_scrapes(tasks):
+    print("\nInterrupted. Cancelling remaining searches...")
+    for task in tasks:
+        task.cancel()
+
+
+async def _run_all(keyword_queries, profiles, config):
+    """
+    Scrape every keyword and profile in a single browser session. Both
+    iterables are read in full before the browser is launched, so a bad input
+    file fails before any scrape starts, and the browser is only launched if
+    there is a query.
+    Returns a list of (search_value, result) pairs, where result is either
+    the collected tweets or the exception raised by that scrape.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES)
+    details = (
+        f"Date range: {config.since_date} to {config.until_date}\n"
+        f"Limit: {config.limit}\n\n"
+    )
+    queries = list(itertools.chain(
+        ((kw, f"Keyword search: {kw}\n{details}", {"keyword": kw}) for kw in keyword_queries),
+        ((profile, f"Profile search: @{profile}\n{details}", {"from_account": profile}) for profile in profiles),
+    ))
+    if not queries:
+        return []
+
+    labels = []
+    tasks = []
+    async with browser_session() as browser:
+        scrape = functools.partial(
+            scrape_search_results, browser=browser, **dataclasses.asdict(config)
+        )
+        for label, header, query in queries:
+            labels.append(label)
+            tasks.append(asyncio.ensure_future(_scrape_one(semaphore, scrape, header, query)))
+
+        # Ctrl-C cancels the scrapes so the browser is closed cleanly; tweets
+        # collected so far are already saved to the output file
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(signal.SIGINT, _cancel_scrapes, tasks)
+            handles_sigint = True
+        except NotImplementedError:
+            # Windows event loops don't support signal handlers
+            handles_sigint = False
+
+        try:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            if handles_sigint:
+                loop.remove_signal_handler(signal.SIGINT)
+    return list(zip(labels, results))
 
-    if args.keywords_file:
-        keyword_queries = load_lines_from_file(args.keywords_file)
 
-    if args.profiles_file:
-        profiles = load_lines_from_file(args.profiles_file)
+def run_search_from_args(args):
+    if not (args.keyword or args.keywords_file or args.from_account or args.profiles_file):
+        print("Error: No keywords or profiles provided")
+        sys.exit(1)
 
+    # Resolve the output path and create its directory once for the whole run
+    output_path = pathlib.Path(args.output or OUTPUT_DEFAULT).resolve()
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    since_date, until_date = get_month_date_range()
+    config = ScrapeConfig(
+        username=args.username,
+        password=args.password,
+        email=args.email,
+        since_date=since_date,
+        until_date=until_date,
+        limit=args.limit,
+        latest=args.latest,
+        output_file=str(output_path),
+        fetch_followers=not args.skip_followers,
+    )
+
+    # A single --keyword/--from-account takes precedence over its file
     if args.keyword:
         keyword_queries = [args.keyword]
+    elif args.keywords_file:
+        keyword_queries = iter_lines_from_file(open_lines_file(args.keywords_file))
+    else:
+        keyword_queries = []
 
     if args.from_account:
         profiles = [args.from_account]
+    elif args.profiles_file:
+        profiles = iter_lines_from_file(open_lines_file(args.profiles_file))
+    else:
+        profiles = []
 
-    if not keyword_queries and not profiles:
-        print("Error: No keywords or profiles provided")
-        sys.exit(1)
-
-    all_collected = []
-
-    for kw in keyword_queries:
-        print(f"Keyword search: {kw}")
-        print(f"Date range: {since_date} to {until_date}")
-        print(f"Limit: {limit}")
-        print()
-
-        collected = asyncio.run(
-            scrape_search_results(
-                keyword=kw,
-                from_account=None,
-                username=username,
-                password=password,
-                email=email,
-                since_date=since_date,
-                until_date=until_date,
-                limit=limit,
-                latest=args.latest,
-                output_file=output_file,
-            )
-        )
+    total_collected = 0
 
-        collected = tag_and_reorder_tweets(collected, kw)
-        all_collected.extend(collected)
-
-    for profile in profiles:
-        print(f"Profile search: @{profile}")
-        print(f"Date range: {since_date} to {until_date}")
-        print(f"Limit: {limit}")
-        print()
-
-        collected = asyncio.run(
-            scrape_search_results(
-                keyword=None,
-                from_account=profile,
-                username=username,
-                password=password,
-                email=email,
-                since_date=since_date,
-                until_date=until_date,
-                limit=limit,
-                latest=args.latest,
-                output_file=output_file,
-            )
+    try:
+        results = run_async(
+            _run_all(iter_unique(keyword_queries), iter_unique(profiles), config)
         )
+    except KeyboardInterrupt:
+        print(f"\nInterrupted. Tweets collected so far are saved to {config.output_file}")
+        sys.exit(130)
 
-        collected = tag_and_reorder_tweets(collected, profile)
-        all_collected.extend(collected)
+    if not results:
+        # The given files contained no entries
+        print("Error: No keywords or profiles provided")
+        sys.exit(1)
 
-    print(
-        f"\nScraping finished. Collected {len(all_collected)} tweets saved to {output_file}"
+    report = []
+    for label, collected in results:
+        if isinstance(collected, asyncio.CancelledError):
+            report.append(f"Cancelled search for {label}\n")
+            continue
+        if isinstance(collected, BaseException):
+            report.append(f"Error while scraping {label}: {collected}\n")
+            continue
+        total_collected += len(collected)
+
+    report.append(
+        f"\nScraping finished. Collected {total_collected} new tweets, saved to {config.output_file}\n"
     )
+    sys.stdout.write("".join(report))
+    sys.stdout.flush()
 
 
-def main():
+@functools.lru_cache(maxsize=1)
+def get_parser():
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Scrape tweets from X.com using keywords or profiles"
     )
@@ -123,12 +221,17 @@ def main():
     parser.add_argument("--limit", "-l", type=int)
     parser.add_argument("--output", "-o", type=str)
     parser.add_argument("--latest", action="store_true")
+    parser.add_argument("--skip-followers", action="store_true")
 
     parser.add_argument("--username", type=str)
     parser.add_argument("--password", type=str)
     parser.add_argument("--email", type=str)
 
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    args = get_parser().parse_args()
     run_search_from_args(args)
 
 
@@ -47,7 +47,7 @@ def run_search_from_args(args):
         output_file=output_file  # Pass output file for incremental saving
     ))
 
-    print(f"\nScraping finished. Collected {len(collected_tweets)} tweets saved to {output_file}")
+    print(f"\nScraping finished. Collected {len(collected_tweets)} new tweets, saved to {output_file}")
 
 def run_search_from_config(config_file):
     """Reads configuration from a JSON file and runs the Twitter search scraper."""
@@ -107,7 +107,7 @@ def run_search_from_config(config_file):
         # The scrape_search_results function returns the list of collected tweets directly
         filtered_tweets = collected_tweets # Assuming filtering is done within the scraper based on date strings
 
-        print(f"Scraping finished. Collected {len(filtered_tweets)} tweets saved to {output_file}")
+        print(f"Scraping finished. Collected {len(filtered_tweets)} new tweets, saved to {output_file}")
 
     except FileNotFoundError:
         print(f"Error: Config file not found at {config_file}")
@@ -0,0 +1,50 @@
+// Anti-detection overrides applied before any page script runs
+(() => {
+    const overrides = {
+        // Remove webdriver property to avoid detection
+        webdriver: () => undefined,
+        // Override the plugins property to use a custom getter
+        plugins: () => [1, 2, 3, 4, 5],
+        // Override the languages property to use a custom getter
+        languages: () => ['en-US', 'en'],
+    };
+    for (const [name, getter] of Object.entries(overrides)) {
+        Object.defineProperty(navigator, name, { get: getter });
+    }
+    
+    // Add chrome object
+    window.chrome = {
+        runtime: {}
+    };
+    
+    // Override permissions
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+            Promise.resolve({ state: Notification.permission }) :
+            originalQuery(parameters)
+    );
+    
+    // Override getBattery
+    if (navigator.getBattery) {
+        navigator.getBattery = () => Promise.resolve({
+            charging: true,
+            chargingTime: 0,
+            dischargingTime: Infinity,
+            level: 1
+        });
+    }
+    
+    // Override webdriver in window
+    Object.defineProperty(window, 'navigator', {
+        value: new Proxy(navigator, {
+            has: (target, key) => (key === 'webdriver' ? false : key in target),
+            get: (target, key) => {
+                if (key === 'webdriver') return undefined;
+                // Bind methods to the real navigator, or calls like sendBeacon throw "Illegal invocation"
+                const value = target[key];
+                return typeof value === 'function' ? value.bind(target) : value;
+            }
+        })
+    });
+})();
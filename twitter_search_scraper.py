@@ -7,18 +7,172 @@ from datetime import datetime, timedelta # Import datetime and timedelta for dat
 import os # Import os to check for file existence
 import urllib.parse # Import urllib.parse for URL encoding
 import re # Import re for regex operations
+import sys # Import sys for platform detection
+import atexit # Import atexit to close the shared event loop on exit
+import contextlib # Import contextlib for the reusable browser session
+import functools # Import functools to cache per-keyword exclusions
+import operator # Import operator to pack Excel rows
+import weakref # Import weakref to remember captured API requests per browser context
+import zipfile # Import zipfile to write large Excel files directly
+from xml.sax.saxutils import escape as xml_escape # Import escape for Excel cell text
 
 # Try to import pandas and openpyxl for Excel support
 try:
     import pandas as pd
+    from openpyxl import Workbook
     EXCEL_SUPPORT = True
 except ImportError:
     EXCEL_SUPPORT = False
 
+# Try to import orjson for faster JSON output file reads and writes
+try:
+    import orjson
+    ORJSON_SUPPORT = True
+except ImportError:
+    ORJSON_SUPPORT = False
+
+def load_tweets_from_json(filepath):
+    """Load the contents of a JSON output file, using orjson when available."""
+    if ORJSON_SUPPORT:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _tweets_to_json_array_bytes(tweets):
+    """Serialize tweets to an indented UTF-8 JSON array, using orjson when available."""
+    if ORJSON_SUPPORT:
+        # orjson writes UTF-8 bytes directly and only supports 2-space indentation
+        return orjson.dumps(tweets, option=orjson.OPT_INDENT_2)
+    return json.dumps(tweets, indent=2, ensure_ascii=False).encode('utf-8')
+
+def save_tweets_to_json(tweets, filepath):
+    """Write tweets to a JSON output file, using orjson when available."""
+    with open(filepath, 'wb') as f:
+        f.write(_tweets_to_json_array_bytes(tweets))
+
+@functools.lru_cache(maxsize=None)
+def is_jsonl_file(filename):
+    """Check if filename is a JSON Lines file (one tweet per line)."""
+    return filename and filename.endswith('.jsonl')
+
+def _tweet_to_json_line(tweet):
+    """Serialize a single tweet to one line of UTF-8 JSON, using orjson when available."""
+    if ORJSON_SUPPORT:
+        return orjson.dumps(tweet) + b"\n"
+    return json.dumps(tweet, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b"\n"
+
+def append_tweets_to_json(tweets, filepath):
+    """
+    Append tweets to a JSON array file in place, with a single write.
+    Only the closing bracket is rewritten, so each save costs the same however
+    large the file grows, and the file is a valid JSON array after every save.
+    Raises ValueError if the file doesn't end with a JSON array.
+    """
+    if not tweets:
+        return
+    
+    with open(filepath, 'r+b') as f:
+        size = f.seek(0, os.SEEK_END)
+        tail_start = max(0, size - 64)
+        f.seek(tail_start)
+        tail = f.read().rstrip()
+        head = tail[:-1].rstrip()
+        if not tail.endswith(b']') or not head:
+            raise ValueError(f"{filepath} does not end with a JSON array")
+        
+        # Serialize the batch as an array (already indented as array items) without its brackets
+        items = _tweets_to_json_array_bytes(tweets)[2:-2]
+        separator = b"\n" if head.endswith(b'[') else b",\n"
+        
+        f.seek(tail_start + len(head))
+        f.write(separator + items + b"\n]")
+        f.truncate()
+
+def iter_tweets_from_jsonl(filepath):
+    """Yield tweets from a JSON Lines output file one at a time, without loading the whole file."""
+    loads = orjson.loads if ORJSON_SUPPORT else json.loads
+    with open(filepath, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+def load_tweets_from_jsonl(filepath):
+    """Load tweets from a JSON Lines output file."""
+    return list(iter_tweets_from_jsonl(filepath))
+
+def append_tweets_to_jsonl(tweets, filepath):
+    """Append tweets to a JSON Lines output file, with a single write."""
+    with open(filepath, 'ab') as f:
+        f.write(b"".join(_tweet_to_json_line(tweet) for tweet in tweets))
+
+def _seen_ids_path(filepath):
+    """Path of the sidecar file listing the tweet IDs saved to a JSON Lines output file."""
+    return filepath + '.ids'
+
+def load_seen_ids_from_jsonl(filepath):
+    """
+    Return the set of tweet IDs saved to a JSON Lines output file.
+    The IDs are read from the sidecar file when it is at least as new as the
+    output file; otherwise the output file is scanned and the sidecar rebuilt.
+    """
+    ids_path = _seen_ids_path(filepath)
+    try:
+        if os.path.getmtime(ids_path) >= os.path.getmtime(filepath):
+            with open(ids_path, encoding='utf-8') as f:
+                return set(f.read().splitlines())
+    except OSError:
+        pass # No sidecar yet
+    
+    seen_ids = {tweet.get('id') for tweet in iter_tweets_from_jsonl(filepath)}
+    seen_ids.discard(None)
+    seen_ids.discard('')
+    with open(ids_path, 'w', encoding='utf-8') as f:
+        f.write("".join(f"{tweet_id}\n" for tweet_id in seen_ids))
+    return seen_ids
+
+def append_seen_ids(tweets, filepath):
+    """Record the IDs of tweets just appended to a JSON Lines output file in its sidecar file."""
+    with open(_seen_ids_path(filepath), 'a', encoding='utf-8') as f:
+        f.write("".join(f"{tweet['id']}\n" for tweet in tweets if tweet.get('id')))
+
+@functools.lru_cache(maxsize=None)
 def is_excel_file(filename):
     """Check if filename is an Excel file."""
     return filename and (filename.endswith('.xlsx') or filename.endswith('.xls'))
 
+# Excel column header for each tweet field
+_EXCEL_COLUMNS = (
+    ('id', 'ID'),
+    ('author', 'Author'),
+    ('username', 'Username'),
+    ('display_name', 'Display Name'),
+    ('body', 'Body'),
+    ('date', 'Date'),
+    ('views', 'Views'),
+    ('replies', 'Replies'),
+    ('reposts', 'Reposts'),
+    ('likes', 'Likes'),
+    ('profile_followers', 'Profile Followers'),
+    ('url', 'URL'),
+    ('images', 'Images'),
+)
+_EXCEL_HEADERS = frozenset(header for _, header in _EXCEL_COLUMNS)
+
+# Reads every Excel column value of a tweet in one C-level call
+_EXCEL_ROW_GETTER = operator.itemgetter(*(key for key, _ in _EXCEL_COLUMNS))
+
+def _excel_row(tweet):
+    """Return the Excel column values of `tweet`, with its image URLs joined into one cell."""
+    try:
+        row = list(_EXCEL_ROW_GETTER(tweet))
+    except KeyError:
+        # Tweets loaded from older output files may be missing some fields
+        row = [tweet.get(key, '') for key, _ in _EXCEL_COLUMNS]
+    images = row[-1]
+    row[-1] = ', '.join(images) if isinstance(images, list) else str(images)
+    return row
+
 def load_existing_tweets_from_excel(filepath):
     """Load existing tweets from Excel file and convert back to tweet format."""
     if not EXCEL_SUPPORT:
@@ -26,31 +180,17 @@ def load_existing_tweets_from_excel(filepath):
     
     try:
         if os.path.exists(filepath):
-            df = pd.read_excel(filepath)
-            tweets = []
-            seen_ids = set()
+            # Read every cell as text, skipping columns we don't map back
+            df = pd.read_excel(filepath, dtype=str, usecols=lambda header: header in _EXCEL_HEADERS).fillna('')
             
-            for _, row in df.iterrows():
-                # Convert Excel row back to tweet format (using Body instead of Text)
-                tweet = {
-                    'id': str(row.get('ID', '')),
-                    'author': str(row.get('Author', '')),
-                    'username': str(row.get('Username', '')),
-                    'display_name': str(row.get('Display Name', '')),
-                    'body': str(row.get('Body', '')),
-                    'date': str(row.get('Date', '')),
-                    'views': str(row.get('Views', '')),
-                    'replies': str(row.get('Replies', '')),
-                    'reposts': str(row.get('Reposts', '')),
-                    'likes': str(row.get('Likes', '')),
-                    'profile_followers': str(row.get('Profile Followers', '')),
-                    'url': str(row.get('URL', '')),
-                    'images': row.get('Images', '').split(', ') if pd.notna(row.get('Images', '')) and row.get('Images', '') else []
-                }
-                tweets.append(tweet)
-                if tweet['id']:
-                    seen_ids.add(tweet['id'])
+            # Convert column by column instead of row by row (using Body instead of Text)
+            keys = [key for key, _ in _EXCEL_COLUMNS]
+            columns = [df[header].tolist() if header in df.columns else [''] * len(df) for _, header in _EXCEL_COLUMNS]
+            columns[-1] = [images.split(', ') if images else [] for images in columns[-1]]
+            tweets = [dict(zip(keys, values)) for values in zip(*columns)]
             
+            seen_ids = set(columns[0])
+            seen_ids.discard('')
             return tweets, seen_ids
     except Exception as e:
         print(f"Warning: Could not load existing Excel file: {e}")
@@ -62,41 +202,251 @@ def save_tweets_to_excel(tweets, filepath):
         print("Warning: pandas/openpyxl not installed. Cannot save to Excel. Install with: pip install pandas openpyxl")
         return False
     
+    if len(tweets) > EXCEL_RAW_WRITE_THRESHOLD:
+        return save_tweets_to_excel_raw(tweets, filepath)
+    
+    # Write next to the output and swap it in once complete, so an interrupted save
+    # never leaves a truncated workbook behind
+    tmp_path = filepath + '.tmp'
     try:
-        # Prepare data for Excel - flatten the structure (excluding link and text fields)
-        excel_data = []
+        # Stream the rows into a write-only workbook, which doesn't build a cell object
+        # for every value before saving (excluding link and text fields)
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet('Sheet1')
+        sheet.append([header for _, header in _EXCEL_COLUMNS])
         for tweet in tweets:
-            row = {
-                'ID': tweet.get('id', ''),
-                'Author': tweet.get('author', ''),
-                'Username': tweet.get('username', ''),
-                'Display Name': tweet.get('display_name', ''),
-                'Body': tweet.get('body', ''),
-                'Date': tweet.get('date', ''),
-                'Views': tweet.get('views', ''),
-                'Replies': tweet.get('replies', ''),
-                'Reposts': tweet.get('reposts', ''),
-                'Likes': tweet.get('likes', ''),
-                'Profile Followers': tweet.get('profile_followers', ''),
-                'URL': tweet.get('url', ''),
-                'Images': ', '.join(tweet.get('images', [])) if isinstance(tweet.get('images'), list) else str(tweet.get('images', ''))
-            }
-            excel_data.append(row)
+            sheet.append(_excel_row(tweet))
         
-        df = pd.DataFrame(excel_data)
-        df.to_excel(filepath, index=False, engine='openpyxl')
+        workbook.save(tmp_path)
+        os.replace(tmp_path, filepath)
         return True
     except Exception as e:
         print(f"Warning: Could not save to Excel: {e}")
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
         return False
 
+# Above this many tweets, Excel files are written as raw sheet XML instead of through openpyxl
+EXCEL_RAW_WRITE_THRESHOLD = 50000
+
+# Characters that aren't allowed in XML and are dropped from Excel cell text
+_XML_ILLEGAL_CHARS_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+# Fixed parts of a single-sheet .xlsx file; only the sheet itself depends on the tweets
+_XLSX_STATIC_PARTS = (
+    ('[Content_Types].xml',
+     '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+     '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+     '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+     '<Default Extension="xml" ContentType="application/xml"/>'
+     '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+     '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+     '</Types>'),
+    ('_rels/.rels',
+     '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+     '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+     '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+     '</Relationships>'),
+    ('xl/workbook.xml',
+     '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+     '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+     'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+     '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets>'
+     '</workbook>'),
+    ('xl/_rels/workbook.xml.rels',
+     '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+     '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+     '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+     '</Relationships>'),
+)
+
+def _xlsx_row(row_number, values):
+    """Serialize one row of cell values as sheet XML with inline strings."""
+    cells = "".join(
+        f'<c t="inlineStr"><is><t xml:space="preserve">{xml_escape(_XML_ILLEGAL_CHARS_RE.sub("", str(value)))}</t></is></c>'
+        if value is not None and value != '' else '<c/>'
+        for value in values
+    )
+    return f'<row r="{row_number}">{cells}</row>'
+
+def save_tweets_to_excel_raw(tweets, filepath):
+    """
+    Save tweets to an Excel file by writing the sheet XML straight into the .xlsx zip,
+    with the same columns as save_tweets_to_excel. Used for very large outputs, where
+    openpyxl's per-cell overhead dominates the save.
+    """
+    tmp_path = filepath + '.tmp'
+    try:
+        with zipfile.ZipFile(tmp_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+            for name, content in _XLSX_STATIC_PARTS:
+                zf.writestr(name, content)
+            
+            with zf.open('xl/worksheets/sheet1.xml', 'w') as sheet:
+                sheet.write(
+                    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                    b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+                )
+                sheet.write(_xlsx_row(1, [header for _, header in _EXCEL_COLUMNS]).encode('utf-8'))
+                for row_number, tweet in enumerate(tweets, start=2):
+                    sheet.write(_xlsx_row(row_number, _excel_row(tweet)).encode('utf-8'))
+                sheet.write(b'</sheetData></worksheet>')
+        os.replace(tmp_path, filepath)
+        return True
+    except Exception as e:
+        print(f"Warning: Could not save to Excel: {e}")
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        return False
+
+# Try to import uvloop for a faster event loop (not supported on Windows)
+try:
+    import uvloop
+    UVLOOP_SUPPORT = sys.platform != 'win32'
+except ImportError:
+    UVLOOP_SUPPORT = False
+
 # Define the path for the browser profile directory
 BROWSER_PROFILE_PATH = "browser_profile"
 
+# Anti-detection script, registered once on the browser context so it runs in every page
+STEALTH_SCRIPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stealth_init.js")
+
+# Requests the scraper never needs - tweet image URLs are read from the DOM, not downloaded
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+# URLs that may be blocked: X's image and video hosts, font files and analytics. Only these
+# are routed through the blocking handler, so every other request (scripts, API calls)
+# goes straight through without a round trip to Python
+BLOCKED_URL_RE = re.compile(r'^https://(?:pbs|video)\.twimg\.com/|\.(?:woff2?|ttf|otf)(?:\?|$)|analytics')
+
+# Attribute set on timeline articles that have already been visited
+SCRAPED_ARTICLE_ATTR = "data-scraper-seen"
+
+# Maximum number of profile pages opened at once to look up follower counts
+MAX_PARALLEL_FOLLOWER_LOOKUPS = 3
+
+# Maximum number of follower count API requests in flight at once; these are plain
+# HTTP requests, so more of them can run than profile pages
+MAX_PARALLEL_FOLLOWER_API_LOOKUPS = 8
+
+# Excel output is rewritten in full on every save, so it's saved every N new tweets
+# and once more when the search ends instead of after every tweet
+EXCEL_SAVE_INTERVAL = 50
+
+# Event loop shared by every run_async call, created on first use
+_LOOP = None
+
+# Browser kept open between searches that don't pass their own, and the exit stack that closes it
+_SHARED_BROWSER = None
+_SHARED_BROWSER_STACK = None
+
+def _close_loop():
+    """Close the shared browser and the shared event loop at interpreter exit."""
+    if _LOOP is not None and not _LOOP.is_closed():
+        try:
+            _LOOP.run_until_complete(close_shared_browser())
+        except Exception as e:
+            print(f"Error closing browser: {e}")
+        _LOOP.run_until_complete(_LOOP.shutdown_asyncgens())
+        _LOOP.close()
+
+def run_async(coro):
+    """
+    Run a coroutine to completion on a shared event loop.
+    The loop (uvloop when available) is created once and reused by later calls,
+    so repeated scrapes in one process don't pay for loop setup and teardown.
+    """
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = uvloop.new_event_loop() if UVLOOP_SUPPORT else asyncio.new_event_loop()
+        asyncio.set_event_loop(_LOOP)
+        atexit.register(_close_loop)
+    return _LOOP.run_until_complete(coro)
+
 def random_sleep_async(min_sec=1, max_sec=3):
     """Asynchronous sleep for a random duration."""
     return asyncio.sleep(random.uniform(min_sec, max_sec))
 
+# Patterns used for every engagement number and follower count, compiled once
+_ENGAGEMENT_RE = re.compile(r'([\d.]+)\s*([KMBkmb]?)')
+_FOLLOWERS_RE = re.compile(r'([\d,.]+[KMBkmb]?)\s*followers?', re.IGNORECASE)
+_OR_TERM_RE = re.compile(r'\(([^)]+)\)')
+
+# URL fragments that mean X.com redirected to a login/authentication page
+_LOGIN_URL_RE = re.compile(r'login|i/flow|account/access|authenticate|signin')
+
+# Page text that means X.com is showing a login prompt or rate limiting us
+_LOGIN_TEXT_RE = re.compile(r'sign in|log in|enter your phone', re.IGNORECASE)
+_LOGIN_REDIRECT_TEXT_RE = re.compile(r'login|sign in', re.IGNORECASE)
+_RATE_LIMIT_TEXT_RE = re.compile(r'rate limit|too many requests', re.IGNORECASE)
+
+# Engagement counts in aria-labels like "1,234 replies" or "10.5K likes"; the first four
+# letters of the `kind` group tell which metric the number belongs to
+_ENGAGEMENT_LABEL_RE = re.compile(
+    r'(\d[\d,.]*[KMBkmb]?)\s*(?P<kind>repl(?:ies|ied|y)|reposts?|retweets?|likes?|liked|views?)',
+    re.IGNORECASE
+)
+
+# Dates in a tweet's <time> text, used when it has no parseable datetime attribute;
+# the named group that matched tells which format the date is in
+_TWEET_DATE_RE = re.compile(
+    r'(?P<month_day>(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2})(?:,\s+(?P<year>\d{4}))?'
+    r'|(?P<ymd>\d{4}/\d{2}/\d{2})'
+    r'|(?P<mdy>\d{2}/\d{2}/\d{4})'
+    r'|(?P<hour>\d{1,2}):(?P<minute>\d{2})\s*(?P<am_pm>AM|PM)?'
+)
+
+# Formats tried, in order, for stored tweet dates that aren't ISO timestamps
+_TWEET_DATE_FORMATS = ('%Y-%m-%d', '%b %d, %Y', '%Y/%m/%d', '%m/%d/%Y')
+
+# Reads only the start of the page text for the login/rate-limit checks, so the whole
+# page isn't sent over from the browser
+_PAGE_TEXT_PREVIEW_JS = "() => (document.body.innerText || '').slice(0, 2000)"
+
+@functools.lru_cache(maxsize=None)
+def extract_account_exclusions(keyword_str):
+    """Extract potential account names from keywords and create exclusion list.
+    Works for both single keywords and multiple keywords (OR queries).
+    For 'PokerStars' or '(PokerStars) OR (pokerstars)', returns ('pokerstars',).
+    Names are lowercased and deduplicated in one pass, since X handles are case-insensitive.
+    """
+    # Check if keyword contains OR (multiple keywords)
+    if ' OR ' in keyword_str.upper():
+        # Extract keywords from OR query: (keyword1) OR (keyword2) OR (keyword3)
+        terms = _OR_TERM_RE.findall(keyword_str)
+    else:
+        terms = (keyword_str,)
+    
+    # Remove @ if present, then drop empty names and duplicates while preserving order
+    names = (term.strip().lstrip('@').strip().lower() for term in terms)
+    return tuple(dict.fromkeys(name for name in names if name))
+
+def _parse_tweet_date_text(text):
+    """
+    Parse the visible text of a tweet's <time> element, like "May 20", "May 20, 2023",
+    "2023/12/31", "12/31/2023" or "10:30 AM" (today), into an ISO date string.
+    Returns the date text as shown if it can't be parsed, or `text` if it has no date.
+    """
+    match = _TWEET_DATE_RE.search(text)
+    if not match:
+        return text
+    
+    try:
+        if match['month_day']:
+            parsed_date = datetime.strptime(f"{match['month_day']} {match['year'] or datetime.now().year}", '%b %d %Y')
+        elif match['ymd']:
+            parsed_date = datetime.strptime(match['ymd'], '%Y/%m/%d')
+        elif match['mdy']:
+            parsed_date = datetime.strptime(match['mdy'], '%m/%d/%Y')
+        else:
+            hour = int(match['hour'])
+            if match['am_pm']:
+                hour = hour % 12 + (12 if match['am_pm'] == 'PM' else 0)
+            parsed_date = datetime.now().replace(hour=hour, minute=int(match['minute']), second=0, microsecond=0)
+    except ValueError:
+        return match.group(0).strip()
+    return parsed_date.isoformat()
+
 def _parse_engagement_number(text):
     """
     Parse engagement numbers from text like "10K", "1.2M", "500", etc.
@@ -105,22 +455,233 @@ def _parse_engagement_number(text):
     if not text:
         return None
     
-    # Remove commas and whitespace
-    text = text.strip().replace(',', '')
+    # Extract the number with its optional K/M/B suffix, ignoring thousands separators
+    # (any digit in the text matches, so there's nothing left to fall back to)
+    match = _ENGAGEMENT_RE.search(text.replace(',', ''))
+    if not match:
+        return None
+    number, suffix = match.groups()
+    return number + suffix.upper() if suffix else number
+
+# Smallest count shown with each suffix on X's profile pages (counts below 10,000 are shown in full)
+_COMPACT_COUNT_UNITS = ((1000000000, 'B'), (1000000, 'M'), (10000, 'K'))
+
+def _format_compact_count(count):
+    """
+    Format a count the way X's profile page shows it and _parse_engagement_number reads it,
+    e.g. 9876 -> "9876", 12345 -> "12.3K", 229812345 -> "229.8M" (truncated, not rounded).
+    """
+    for threshold, suffix in _COMPACT_COUNT_UNITS:
+        if count >= threshold:
+            unit = 1000 if suffix == 'K' else threshold
+            tenths = count * 10 // unit
+            number = str(tenths // 10) if tenths % 10 == 0 else f"{tenths // 10}.{tenths % 10}"
+            return number + suffix
+    return str(count)
+
+# Scrolls one viewport down, waits (up to the timeout) for the timeline to grow past the
+# last height and returns the new height, all in one round trip
+_SCROLL_AND_WAIT_JS = """
+    async ([lastHeight, timeout]) => {
+        window.scrollBy(0, window.innerHeight);
+        const deadline = Date.now() + timeout;
+        while (document.body.scrollHeight <= lastHeight && Date.now() < deadline) {
+            await new Promise((resolve) => setTimeout(resolve, 100));
+        }
+        return document.body.scrollHeight;
+    }
+"""
+
+# Longest wait (ms) for a scroll to load more tweets before the loop moves on anyway
+SCROLL_LOAD_TIMEOUT = 2000
+
+# Returns the status link href (or null) of each tweet <article> passed in
+_TWEET_URLS_JS = """
+    (articles) => articles.map((article) => {
+        const link = article.querySelector("a[href*='/status/']");
+        return link ? link.getAttribute('href') : null;
+    })
+"""
+
+# Reads every raw field the scraper needs from one tweet <article> in a single round trip;
+# all parsing and normalization stays in Python
+_EXTRACT_TWEET_FIELDS_JS = """
+    (article) => {
+        const textOf = (el) => el ? (el.innerText || el.textContent || '') : null;
+        const usernameLink = article.querySelector('a[role="link"][href^="/"]');
+        const time = article.querySelector('time');
+        const ariaLabels = Array.from(article.querySelectorAll('[aria-label]'))
+            .map((el) => el.getAttribute('aria-label'))
+            .filter(Boolean);
+        // Only read the whole tweet text for a view count when no aria-label carries one
+        const viewsPattern = /(\\d[\\d,.]*[KMBkmb]?)\\s*views?/i;
+        const viewsMatch = ariaLabels.some((label) => viewsPattern.test(label))
+            ? null
+            : (article.innerText || '').match(viewsPattern);
+        return {
+            text: textOf(article.querySelector('[data-testid="tweetText"]')),
+            username_href: usernameLink ? usernameLink.getAttribute('href') : null,
+            user_names: textOf(article.querySelector('[data-testid="User-Name"]')),
+            images: Array.from(article.querySelectorAll('img[src^="https://pbs.twimg.com/"]'))
+                .map((img) => img.getAttribute('src'))
+                .filter(Boolean),
+            time: time ? { datetime: time.getAttribute('datetime'), text: textOf(time) } : null,
+            aria_labels: ariaLabels,
+            reply_text: textOf(article.querySelector('[data-testid="reply"]')),
+            retweet_text: textOf(article.querySelector('[data-testid="retweet"]')),
+            like_text: textOf(article.querySelector('[data-testid="like"]')),
+            views_text: viewsMatch ? viewsMatch[1] : null,
+        };
+    }
+"""
+
+# Same as _EXTRACT_TWEET_FIELDS_JS for a list of articles, so a whole scroll is read at once
+_EXTRACT_TWEETS_FIELDS_JS = f"(articles) => articles.map({_EXTRACT_TWEET_FIELDS_JS.strip()})"
+
+# Finds the follower count on a profile page, trying the most reliable elements first:
+# /followers links, then follower spans, then follower data-testid elements, then all page text
+_FOLLOWER_COUNT_JS = """
+    () => {
+        const pattern = /([\\d,.]+[KMBkmb]?)\\s*followers?/i;
+        const textOf = (el) => el.innerText || el.textContent || '';
+        
+        for (const link of document.querySelectorAll('a[href*="/followers"]')) {
+            const match = textOf(link).match(pattern);
+            if (match) return match[1];
+        }
+        
+        for (const span of document.querySelectorAll('span')) {
+            const text = textOf(span);
+            const lower = text.toLowerCase();
+            if (lower.includes('followers') && !lower.includes('following')) {
+                const match = text.match(pattern);
+                if (match) return match[1];
+            }
+        }
+        
+        for (const el of document.querySelectorAll('[data-testid*="follower"], [data-testid*="Follower"]')) {
+            const match = `${textOf(el)} ${el.getAttribute('aria-label') || ''}`.match(pattern);
+            if (match) return match[1];
+        }
+        
+        const match = (document.body.innerText || document.body.textContent || '').match(pattern);
+        return match ? match[1] : null;
+    }
+"""
+
+# X's GraphQL profile request (URL and headers) captured from the first profile page loaded
+# in each browser context, replayed to look up other profiles without opening a page
+_USER_LOOKUP_REQUESTS = weakref.WeakKeyDictionary()
+
+def _capture_user_lookup_request(context, request):
+    """Remember the first UserByScreenName GraphQL request made in `context`."""
+    if context not in _USER_LOOKUP_REQUESTS and "/UserByScreenName" in request.url:
+        _USER_LOOKUP_REQUESTS[context] = (request.url, request.headers)
+
+async def _fetch_follower_count_api(context, username):
+    """
+    Look up the follower count of `username` by replaying the captured GraphQL profile
+    request with the username swapped in, using the context's cookies.
+    Returns the count as a string in the profile page's format (e.g. "229.8M"), or None
+    if no request has been captured yet or the lookup failed.
+    """
+    captured = _USER_LOOKUP_REQUESTS.get(context)
+    if captured is None:
+        return None
+    
+    url, headers = captured
+    try:
+        parts = urllib.parse.urlsplit(url)
+        query = urllib.parse.parse_qs(parts.query)
+        variables = json.loads(query['variables'][0])
+        variables['screen_name'] = username
+        query['variables'] = [json.dumps(variables, separators=(',', ':'))]
+        lookup_url = urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(query, doseq=True)))
+        
+        response = await context.request.get(lookup_url, headers=headers, timeout=10000)
+        if not response.ok:
+            return None
+        data = await response.json()
+        return _format_compact_count(int(data['data']['user']['result']['legacy']['followers_count']))
+    except Exception:
+        return None
+
+async def _fetch_follower_count(context, username, page_pool=None):
+    """
+    Read the follower count of `username`, through X's GraphQL API when a profile request
+    has been captured, otherwise by loading the profile in a page of `context`.
+    If `page_pool` (a list of idle pages) is given, the page is taken from it and put back
+    afterwards, so lookups reuse pages instead of opening and closing one each.
+    Returns the count as a string (e.g. "229.8M"), or None if it couldn't be found.
+    """
+    follower_count = await _fetch_follower_count_api(context, username)
+    if follower_count is not None:
+        return follower_count
+    return await _fetch_follower_count_page(context, username, page_pool)
+
+async def _fetch_follower_count_page(context, username, page_pool=None):
+    """
+    Read the follower count of `username` by loading the profile in a page of `context`;
+    `page_pool` works as in _fetch_follower_count.
+    Returns the count as a string (e.g. "229.8M"), or None if it couldn't be found.
+    """
+    follower_count = None
+    profile_page = None
+    while page_pool and profile_page is None:
+        profile_page = page_pool.pop()
+        if profile_page.is_closed():
+            profile_page = None
     
-    # Try to extract number with optional K/M/B suffix
-    match = re.search(r'([\d.]+)\s*([KMBkmb]?)\s*', text)
-    if match:
-        number = match.group(1)
-        suffix = match.group(2).upper() if match.group(2) else ''
-        return f"{number}{suffix}" if suffix else number
+    if profile_page is None:
+        try:
+            profile_page = await context.new_page()
+        except Exception:
+            return None
+        
+        # Capture the profile's GraphQL request so later lookups can skip the page load
+        if context not in _USER_LOOKUP_REQUESTS:
+            profile_page.on("request", functools.partial(_capture_user_lookup_request, context))
     
-    # If no match, try to extract just numbers
-    numbers = re.findall(r'\d+', text)
-    if numbers:
-        return numbers[0]
+    try:
+        await profile_page.goto(f"https://x.com/{username}", timeout=30000, wait_until='domcontentloaded')
+        await asyncio.sleep(0.5)  # Short wait for page to load
+        
+        # Wait for profile stats to load (with shorter timeout)
+        try:
+            await profile_page.wait_for_selector('a[href*="/followers"]', timeout=2000)
+        except:
+            pass  # Continue even if selector doesn't appear
+        
+        # Try every lookup method in a single round trip to the browser
+        follower_count_js = await profile_page.evaluate(_FOLLOWER_COUNT_JS)
+        if follower_count_js:
+            follower_count = _parse_engagement_number(follower_count_js)
+    except Exception:
+        pass
+    finally:
+        if page_pool is not None:
+            page_pool.append(profile_page)
+        else:
+            try:
+                await profile_page.close()
+            except:
+                pass
     
-    return None
+    return follower_count
+
+def _finished_follower_count(follower_task):
+    """Return the result of a follower lookup task, or None if it hasn't finished or failed."""
+    if not follower_task.done() or follower_task.cancelled() or follower_task.exception() is not None:
+        return None
+    return follower_task.result()
+
+async def _close_pages(pages):
+    """Close every page in `pages`, ignoring pages that are already closed."""
+    for page in pages:
+        try:
+            await page.close()
+        except Exception:
+            pass
 
 async def scrape_search_results(
     keyword: str = None,
@@ -133,7 +694,9 @@ async def scrape_search_results(
     limit: int = None, # Max number of tweets to collect
     latest: bool = False, # If True, get latest tweets from last 24 hours with f=live
     output_file: str = None, # Output file path to save tweets incrementally
-    app_instance=None # Pass the main application instance to emit signals (used in GUI, None in CLI)
+    fetch_followers: bool = True, # If False, skip the profile follower count lookups
+    app_instance=None, # Pass the main application instance to emit signals (used in GUI, None in CLI)
+    browser=None # Optional browser context from browser_session() to reuse across searches
 ):
     """
     Scrapes tweets from x.com search results using Playwright with persistent browser profile.
@@ -148,8 +711,15 @@ async def scrape_search_results(
         until_date: The end date for filtering (YYYY-MM-DD).
         limit: The maximum number of tweets to collect.
         latest: If True, get latest tweets from last 24 hours using f=live parameter.
-        output_file: Path to JSON file to save tweets incrementally as they're collected.
+        output_file: Path to a .json, .jsonl or Excel file to save tweets incrementally as they're collected.
+        fetch_followers: If False, don't look up each author's follower count; the
+                         'profile_followers' field is "N/A" for every tweet.
         app_instance: The main PyQt application instance to emit signals.
+        browser: Optional browser context from browser_session(). When given, the search
+                 runs in a new page of that browser, which is left open for further searches.
+
+    Returns:
+        The tweets collected by this search, not including tweets already in output_file.
     """
     # Validate that either keyword or from_account is provided
     if not keyword and not from_account:
@@ -181,118 +751,57 @@ async def scrape_search_results(
                 all_collected_tweets = []
                 print(f"Created new output file: {output_file}")
         else:
-            # JSON file handling
+            # JSON / JSON Lines file handling
             if os.path.exists(output_file):
                 try:
-                    with open(output_file, 'r', encoding='utf-8') as f:
-                        existing_tweets = json.load(f)
-                        if isinstance(existing_tweets, list):
-                            all_collected_tweets = existing_tweets
-                            seen_tweet_ids = {tweet.get('id') for tweet in existing_tweets if tweet.get('id')}
-                            print(f"Loaded {len(existing_tweets)} existing tweets from {output_file}")
+                    if is_jsonl_file(output_file):
+                        # JSON Lines is appended to and never rewritten, so only the IDs of
+                        # the existing tweets are kept, read from the sidecar file when it's current
+                        seen_tweet_ids = load_seen_ids_from_jsonl(output_file)
+                        print(f"Loaded {len(seen_tweet_ids)} existing tweet IDs from {output_file}")
+                        existing_tweets = None
+                    else:
+                        existing_tweets = load_tweets_from_json(output_file)
+                    if isinstance(existing_tweets, list):
+                        all_collected_tweets = existing_tweets
+                        seen_tweet_ids = {tweet.get('id') for tweet in existing_tweets}
+                        seen_tweet_ids.discard(None)
+                        seen_tweet_ids.discard('')
+                        print(f"Loaded {len(existing_tweets)} existing tweets from {output_file}")
                 except (json.JSONDecodeError, FileNotFoundError):
                     # If file is corrupted or doesn't exist, start fresh
                     all_collected_tweets = []
+            elif is_jsonl_file(output_file):
+                # Create empty file to append tweets to, and a fresh sidecar for its IDs
+                open(output_file, 'wb').close()
+                open(_seen_ids_path(output_file), 'wb').close()
+                print(f"Created new output file: {output_file}")
             else:
                 # Create empty file with empty array
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump([], f, indent=4, ensure_ascii=False)
+                save_tweets_to_json([], output_file)
                 print(f"Created new output file: {output_file}")
+    
+    loaded_count = len(all_collected_tweets) # Tweets already in the output file
 
-    async with async_playwright() as p:
-        browser = None # Initialize browser to None
+    async with contextlib.AsyncExitStack() as stack:
         try:
-            # Launch browser with persistent context (browser profile)
-            # This will automatically load saved cookies and session data
-            print(f"Launching browser with profile: {BROWSER_PROFILE_PATH}")
-            
-            # Check for lockfile and warn if profile might be in use
-            lockfile_path = os.path.join(BROWSER_PROFILE_PATH, "lockfile")
-            if os.path.exists(lockfile_path):
-                print("WARNING: Browser profile lockfile exists. Another browser instance might be using this profile.")
-                print("If you have Chrome/Chromium open, please close it and try again.")
-            
-            browser = await p.chromium.launch_persistent_context(
-                user_data_dir=BROWSER_PROFILE_PATH,
-                headless=False,  # Always use headful mode (visible browser)
-                slow_mo=100,
-                viewport={'width': 1366, 'height': 768},  # Common laptop screen size
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                locale='en-US',
-                timezone_id='America/New_York',
-                permissions=['geolocation'],
-                extra_http_headers={
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                },
-                args=[
-                    '--disable-blink-features=AutomationControlled',  # Hide automation flags
-                    '--disable-dev-shm-usage',
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                ]
-            )
-            
-            # Get the first page (persistent context creates a page automatically)
-            # Wait a moment for browser to fully initialize
-            await asyncio.sleep(0.5)
+            if browser is None:
+                if asyncio.get_running_loop() is _LOOP:
+                    # Reuse the browser kept open by earlier searches in this process,
+                    # launching it on the first one; run_async closes it at exit
+                    browser = await get_shared_browser()
+                else:
+                    # On any other loop (e.g. asyncio.run) nothing would close a shared
+                    # browser before the loop ends, so launch one for this search only
+                    browser = await stack.enter_async_context(browser_session())
             
-            pages = browser.pages
-            if pages:
-                page = pages[0]
-            else:
-                page = await browser.new_page()
+            # Use a dedicated page, so a shared browser stays open for later searches
+            page = await browser.new_page()
+            stack.push_async_callback(page.close)
             
-            print("Browser initialized successfully")
-
-            # Enhanced anti-detection script
-            await page.add_init_script("""
-                // Remove webdriver property
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-                
-                // Override plugins
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5]
-                });
-                
-                // Override languages
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['en-US', 'en']
-                });
-                
-                // Add chrome object
-                window.chrome = {
-                    runtime: {}
-                };
-                
-                // Override permissions
-                const originalQuery = window.navigator.permissions.query;
-                window.navigator.permissions.query = (parameters) => (
-                    parameters.name === 'notifications' ?
-                        Promise.resolve({ state: Notification.permission }) :
-                        originalQuery(parameters)
-                );
-                
-                // Override getBattery
-                if (navigator.getBattery) {
-                    navigator.getBattery = () => Promise.resolve({
-                        charging: true,
-                        chargingTime: 0,
-                        dischargingTime: Infinity,
-                        level: 1
-                    });
-                }
-                
-                // Override webdriver in window
-                Object.defineProperty(window, 'navigator', {
-                    value: new Proxy(navigator, {
-                        has: (target, key) => (key === 'webdriver' ? false : key in target),
-                        get: (target, key) => (key === 'webdriver' ? undefined : target[key])
-                    })
-                });
-            """)
+            # Pages reused by this search's follower lookups, closed when it ends
+            follower_pages = []
+            stack.push_async_callback(_close_pages, follower_pages)
 
             # Use saved browser profile - proceed directly to search
             # The persistent context automatically loads cookies, so we can go straight to search
@@ -301,22 +810,124 @@ async def scrape_search_results(
             # Proceed to search and scrape
             await _perform_search_and_scrape(
                 page, keyword, from_account, since_date, until_date, limit, latest, output_file,
-                all_collected_tweets, seen_tweet_ids, app_instance
+                all_collected_tweets, seen_tweet_ids, fetch_followers, follower_pages, app_instance
             )
-            return all_collected_tweets
+            return all_collected_tweets[loaded_count:]
 
         except Exception as e:
             print(f"An error occurred: {e}")
             if app_instance: app_instance.error.emit(f"An error occurred: {e}")
             # Return current collected tweets on error
-            return all_collected_tweets
+            return all_collected_tweets[loaded_count:]
 
         finally:
-            if browser:
-                await browser.close()
-                print("Browser closed.")
+            # Save tweets buffered since the last periodic Excel save, including
+            # when the search failed or was cancelled
+            if output_file and is_excel_file(output_file) and len(all_collected_tweets) > loaded_count:
+                print(f"Saving final results to Excel file: {output_file}")
+                save_tweets_to_excel(all_collected_tweets, output_file)
+
+    return all_collected_tweets[loaded_count:] # Should be covered by returns in try/except blocks, but here as fallback
+
+async def _block_unneeded_requests(route):
+    """Abort image, media, font and analytics requests; let everything else through."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or "analytics" in request.url:
+        await route.abort()
+    else:
+        await route.continue_()
+
+@contextlib.asynccontextmanager
+async def browser_session():
+    """
+    Launch the persistent browser profile and close it on exit.
+    Pass the yielded context as `browser` to scrape_search_results to run several
+    searches in one browser instead of relaunching it for every search.
+    """
+    async with async_playwright() as p:
+        # Launch browser with persistent context (browser profile)
+        # This will automatically load saved cookies and session data
+        print(f"Launching browser with profile: {BROWSER_PROFILE_PATH}")
+        
+        # Check for lockfile and warn if profile might be in use
+        lockfile_path = os.path.join(BROWSER_PROFILE_PATH, "lockfile")
+        if os.path.exists(lockfile_path):
+            print("WARNING: Browser profile lockfile exists. Another browser instance might be using this profile.")
+            print("If you have Chrome/Chromium open, please close it and try again.")
+        
+        browser = await p.chromium.launch_persistent_context(
+            user_data_dir=BROWSER_PROFILE_PATH,
+            headless=False,  # Always use headful mode (visible browser)
+            viewport={'width': 1366, 'height': 768},  # Common laptop screen size
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            locale='en-US',
+            timezone_id='America/New_York',
+            permissions=['geolocation'],
+            extra_http_headers={
+                'Accept-Language': 'en-US,en;q=0.9',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            },
+            args=[
+                '--disable-blink-features=AutomationControlled',  # Hide automation flags
+                '--disable-dev-shm-usage',
+                '--no-sandbox',
+                '--disable-setuid-sandbox',
+            ]
+        )
+        try:
+            # Register the anti-detection script once for every page in the context
+            await browser.add_init_script(path=STEALTH_SCRIPT_PATH)
+            
+            # Skip downloading resources that text extraction doesn't need, on every page
+            await browser.route(BLOCKED_URL_RE, _block_unneeded_requests)
+            
+            # Wait a moment for browser to fully initialize
+            await asyncio.sleep(0.5)
+            print("Browser initialized successfully")
+            
+            # Verify the profile's cookies are loaded, once for the whole session
+            try:
+                x_cookies = await browser.cookies(["https://x.com", "https://twitter.com"])
+                if x_cookies:
+                    print(f"Session active: {len(x_cookies)} X.com cookies found")
+                else:
+                    print("WARNING: No X.com cookies found - may need to re-login")
+            except:
+                pass
+            yield browser
+        finally:
+            await browser.close()
+            print("Browser closed.")
+
+def _forget_shared_browser(browser):
+    """Drop the shared browser once it has been closed, so the next search relaunches it."""
+    global _SHARED_BROWSER
+    if browser is _SHARED_BROWSER:
+        _SHARED_BROWSER = None
+
+async def get_shared_browser():
+    """
+    Return the browser shared by searches in this process, launching it on first use.
+    It stays open between scrape_search_results calls, so repeated searches skip the
+    Chromium cold start, and is closed by close_shared_browser or at interpreter exit.
+    Only searches running on the run_async loop use it.
+    """
+    global _SHARED_BROWSER, _SHARED_BROWSER_STACK
+    if _SHARED_BROWSER is None:
+        await close_shared_browser() # Clean up after a browser that was closed from outside
+        stack = contextlib.AsyncExitStack()
+        browser = await stack.enter_async_context(browser_session())
+        browser.on("close", _forget_shared_browser)
+        _SHARED_BROWSER, _SHARED_BROWSER_STACK = browser, stack
+    return _SHARED_BROWSER
 
-    return all_collected_tweets # Should be covered by returns in try/except blocks, but here as fallback
+async def close_shared_browser():
+    """Close the browser opened by get_shared_browser, if any."""
+    global _SHARED_BROWSER, _SHARED_BROWSER_STACK
+    stack = _SHARED_BROWSER_STACK
+    _SHARED_BROWSER = _SHARED_BROWSER_STACK = None
+    if stack is not None:
+        await stack.aclose()
 
 # Helper function for performing search and scraping
 async def _perform_search_and_scrape(
@@ -330,111 +941,60 @@ async def _perform_search_and_scrape(
      output_file,
      all_collected_tweets, # Pass lists/sets to be modified in place
      seen_tweet_ids,
+     fetch_followers,
+     follower_pages, # Idle pages shared by the follower lookups
      app_instance
     ):
     
-    def save_tweet_incremental(tweet_info):
-        """Save a single tweet to the output file incrementally."""
-        if not output_file:
+    # Savers for each output file type; the one to use is picked once below
+    def save_to_excel(new_tweets):
+        # Excel can't be appended to, so rewrite the workbook from the collected
+        # tweets each time another EXCEL_SAVE_INTERVAL tweets have been collected
+        # (the rest are saved at the end)
+        previous_count = len(all_collected_tweets) - len(new_tweets)
+        if len(all_collected_tweets) // EXCEL_SAVE_INTERVAL > previous_count // EXCEL_SAVE_INTERVAL:
+            save_tweets_to_excel(all_collected_tweets, output_file)
+    
+    def save_to_jsonl(new_tweets):
+        # JSON Lines: append one line per tweet, then their IDs to the sidecar
+        append_tweets_to_jsonl(new_tweets, output_file)
+        append_seen_ids(new_tweets, output_file)
+    
+    def save_to_json(new_tweets):
+        # JSON array: append the tweets in place before the closing bracket
+        try:
+            append_tweets_to_json(new_tweets, output_file)
+        except (ValueError, FileNotFoundError):
+            # Missing or not a JSON array - rewrite it with everything collected so far
+            save_tweets_to_json(all_collected_tweets, output_file)
+    
+    if not output_file:
+        save_new_tweets = None
+    elif is_excel_file(output_file):
+        save_new_tweets = save_to_excel
+    elif is_jsonl_file(output_file):
+        save_new_tweets = save_to_jsonl
+    else:
+        save_new_tweets = save_to_json
+    
+    def save_tweets_incremental(new_tweets):
+        """Save a batch of newly collected tweets to the output file with one open and write."""
+        if save_new_tweets is None or not new_tweets:
             return
         
         try:
-            # Check if it's an Excel file
-            if is_excel_file(output_file):
-                # For Excel, we need to read all existing tweets, add new one, and rewrite
-                if os.path.exists(output_file):
-                    existing_tweets, _ = load_existing_tweets_from_excel(output_file)
-                    tweets = existing_tweets
-                else:
-                    tweets = []
-                
-                # Append new tweet
-                tweets.append(tweet_info)
-                
-                # Save to Excel
-                save_tweets_to_excel(tweets, output_file)
-            else:
-                # JSON file handling
-                if os.path.exists(output_file):
-                    with open(output_file, 'r', encoding='utf-8') as f:
-                        tweets = json.load(f)
-                        if not isinstance(tweets, list):
-                            tweets = []
-                else:
-                    tweets = []
-                
-                # Append new tweet
-                tweets.append(tweet_info)
-                
-                # Write back to file
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(tweets, f, indent=4, ensure_ascii=False)
+            save_new_tweets(new_tweets)
         except Exception as e:
             print(f"Warning: Could not save tweet incrementally: {e}")
 
-    # Helper function to extract account names from keywords and create exclusions
-    def extract_account_exclusions(keyword_str):
-        """Extract potential account names from keywords and create exclusion list.
-        Works for both single keywords and multiple keywords (OR queries).
-        For 'PokerStars' or 'PokerStars OR pokerstars', extracts 'pokerstars' and 'PokerStars' for exclusion.
-        """
-        exclusions = []
-        # Check if keyword contains OR (multiple keywords)
-        if ' OR ' in keyword_str.upper():
-            # Extract keywords from OR query: (keyword1) OR (keyword2) OR (keyword3)
-            import re
-            # Match patterns like (keyword) in the OR query
-            matches = re.findall(r'\(([^)]+)\)', keyword_str)
-            for match in matches:
-                kw = match.strip()
-                # Remove @ if present
-                account_name = kw.lstrip('@').strip()
-                if account_name:
-                    # Add both lowercase and original case variants if different
-                    exclusions.append(account_name.lower())
-                    if account_name.lower() != account_name:
-                        exclusions.append(account_name)
-        else:
-            # Single keyword - extract account name variants
-            kw = keyword_str.strip().lstrip('@').strip()
-            if kw:
-                # Add both lowercase and original case variants
-                exclusions.append(kw.lower())
-                if kw.lower() != kw:
-                    exclusions.append(kw)
-        
-        # Remove duplicates while preserving order (case-insensitive)
-        seen = set()
-        unique_exclusions = []
-        for exc in exclusions:
-            exc_lower = exc.lower()
-            if exc_lower not in seen:
-                seen.add(exc_lower)
-                unique_exclusions.append(exc)
-        
-        return unique_exclusions
-    
     # Construct search query based on keyword or from_account
     if from_account:
         # Remove @ if user included it
         account_name = from_account.lstrip('@')
         # For account-based search with keywords: (keyword1 OR keyword2) -@account1 -@account2
         if keyword:
-            # Extract account exclusions from keyword
-            account_exclusions = extract_account_exclusions(keyword)
-            # Add the from_account to exclusions (both cases)
-            account_exclusions.append(account_name.lower())
-            if account_name.lower() != account_name:
-                account_exclusions.append(account_name)
-            
-            # Remove duplicates
-            seen = set()
-            unique_exclusions = []
-            for exc in account_exclusions:
-                exc_lower = exc.lower()
-                if exc_lower not in seen:
-                    seen.add(exc_lower)
-                    unique_exclusions.append(exc)
+            # Extract account exclusions from keyword and add the from_account, without duplicates
+            unique_exclusions = tuple(dict.fromkeys((*extract_account_exclusions(keyword), account_name.lower())))
             
             # Build exclusion string: -@account1 -@account2
             exclusion_str = " ".join(f"-@{acc}" for acc in unique_exclusions)
@@ -488,8 +1048,7 @@ async def _perform_search_and_scrape(
     print(f"Current URL: {current_url}")
     
     # Check if redirected to login or authentication page
-    login_indicators = ["login", "i/flow", "account/access", "authenticate", "signin"]
-    if any(indicator in current_url.lower() for indicator in login_indicators):
+    if _LOGIN_URL_RE.search(current_url.lower()):
         print("\n" + "="*60)
         print("ERROR: Session expired - X.com is asking for login")
         print("="*60)
@@ -505,9 +1064,9 @@ async def _perform_search_and_scrape(
     
     # Also check page content for login prompts
     try:
-        page_text = await page.evaluate("() => document.body.innerText || ''")
-        if "sign in" in page_text.lower() or "log in" in page_text.lower() or "enter your phone" in page_text.lower():
-            if "search" not in page_text.lower()[:500]:  # Make sure it's not just a search page with login button
+        page_text = await page.evaluate(_PAGE_TEXT_PREVIEW_JS)
+        if _LOGIN_TEXT_RE.search(page_text):
+            if "search" not in page_text[:500].lower():  # Make sure it's not just a search page with login button
                 print("\n" + "="*60)
                 print("ERROR: Login page detected in content")
                 print("="*60)
@@ -518,17 +1077,6 @@ async def _perform_search_and_scrape(
     except:
         pass
     
-    # Verify cookies are loaded (check after navigation)
-    try:
-        cookies = await page.context.cookies()
-        x_cookies = [c for c in cookies if 'x.com' in c.get('domain', '') or 'twitter.com' in c.get('domain', '')]
-        if x_cookies:
-            print(f"Session active: {len(x_cookies)} X.com cookies found")
-        else:
-            print("WARNING: No X.com cookies found - may need to re-login")
-    except:
-        pass
-    
     # print("Waiting for search results...")
     try:
         await page.wait_for_selector('article', timeout=80000)
@@ -538,10 +1086,10 @@ async def _perform_search_and_scrape(
         
         # Try to get more diagnostic info
         try:
-            body_text = await page.evaluate("() => document.body.innerText")
-            if "login" in body_text.lower() or "sign in" in body_text.lower():
+            body_text = await page.evaluate(_PAGE_TEXT_PREVIEW_JS)
+            if _LOGIN_REDIRECT_TEXT_RE.search(body_text):
                 print("ERROR: Appears to be redirected to login page. Browser profile may have expired.")
-            elif "rate limit" in body_text.lower() or "too many requests" in body_text.lower():
+            elif _RATE_LIMIT_TEXT_RE.search(body_text):
                 print("ERROR: Rate limited by X.com. Please wait before trying again.")
             else:
                 print(f"Page body preview: {body_text[:500]}")
@@ -560,138 +1108,66 @@ async def _perform_search_and_scrape(
     
     # Cache for follower count when doing account-based search (all tweets from same account)
     cached_follower_count = None
-    account_followers_fetched = False
     
-    # Cache for follower counts per username (for keyword searches to avoid re-fetching)
-    follower_count_cache = {}  # {username: follower_count}
+    # Follower lookups per username for keyword searches, shared by all tweets from the same
+    # account and run in the background so they overlap with extracting the other tweets
+    follower_tasks = {}  # {username: task resolving to the follower count}
+    follower_semaphore = asyncio.Semaphore(MAX_PARALLEL_FOLLOWER_LOOKUPS)
+    follower_api_semaphore = asyncio.Semaphore(MAX_PARALLEL_FOLLOWER_API_LOOKUPS)
+    
+    async def fetch_followers_limited(username):
+        # API lookups and profile page loads are limited separately, so cheap API
+        # requests don't wait behind page loads
+        async with follower_api_semaphore:
+            follower_count = await _fetch_follower_count_api(page.context, username)
+        if follower_count is not None:
+            return follower_count
+        async with follower_semaphore:
+            return await _fetch_follower_count_page(page.context, username, follower_pages)
+    
+    async def save_collected_tweets(collected):
+        """Fill in follower counts, then print and save (tweet_info, follower_task) pairs in order."""
+        new_tweets = []
+        for tweet_info, follower_task in collected:
+            if follower_task is not None:
+                tweet_info['profile_followers'] = await follower_task or "N/A"
+            new_tweets.append(tweet_info)
+            
+            # Print collected tweet information to the console in a user-friendly format
+            if app_instance is None: # Only print in CLI mode
+                print("--------------------")
+                print(f"ID: {tweet_info.get('id', 'N/A')}")
+                print(f"Views: {tweet_info.get('views', 'N/A')}")
+                print(f"Replies: {tweet_info.get('replies', 'N/A')}")
+                print(f"Reposts: {tweet_info.get('reposts', 'N/A')}")
+                print(f"Likes: {tweet_info.get('likes', 'N/A')}")
+                print(f"Author: {tweet_info.get('author', 'N/A')}")
+                print(f"Profile Followers: {tweet_info.get('profile_followers', 'N/A')}")
+                print(f"Date: {tweet_info.get('date', 'N/A')}")
+                print(f"URL: {tweet_info.get('url', 'N/A')}")
+                print(f"Body:\n{tweet_info.get('body', 'Could not retrieve text.')}")
+                if tweet_info.get('images'):
+                    print(f"Images: {', '.join(tweet_info.get('images'))}")
+                print("--------------------")
+        
+        # Save the batch to the file in one write
+        all_collected_tweets.extend(new_tweets)
+        save_tweets_incremental(new_tweets)
+    
+    unsaved_tweets = [] # Collected tweets still waiting for their follower lookups
     
     # For account-based searches, fetch follower count once before the loop
-    if from_account:
+    if from_account and fetch_followers:
         account_name = from_account.lstrip('@')
         print(f"Fetching follower count for @{account_name} (will be reused for all tweets)...")
-        try:
-            context = page.context
-            profile_url = f"https://x.com/{account_name}"
-            new_page = await context.new_page()
-            
-            try:
-                await new_page.goto(profile_url, timeout=30000, wait_until='domcontentloaded')
-                await asyncio.sleep(0.5)  # Short wait for page to load
-                
-                # Wait for profile stats to load (with shorter timeout)
-                try:
-                    await new_page.wait_for_selector('a[href*="/followers"]', timeout=2000)
-                except:
-                    pass  # Continue even if selector doesn't appear
-                
-                # Method 1: Look for link with /followers in href (most reliable)
-                try:
-                    follower_links = await new_page.query_selector_all('a[href*="/followers"]')
-                    for follower_link in follower_links:
-                        try:
-                            link_text = await follower_link.inner_text()
-                            # Look for pattern like "229.8M Followers" or "1,234 Followers"
-                            follower_match = re.search(r'([\d,.]+[KMBkmb]?)\s*followers?', link_text, re.IGNORECASE)
-                            if follower_match:
-                                cached_follower_count = _parse_engagement_number(follower_match.group(1))
-                                break
-                        except:
-                            continue
-                except:
-                    pass
-                
-                # Method 2: Look for span elements containing follower text
-                if cached_follower_count is None:
-                    try:
-                        all_spans = await new_page.query_selector_all('span')
-                        for span in all_spans:
-                            try:
-                                text = await span.inner_text()
-                                if 'followers' in text.lower() and 'following' not in text.lower():
-                                    follower_match = re.search(r'([\d,.]+[KMBkmb]?)\s*followers?', text, re.IGNORECASE)
-                                    if follower_match:
-                                        cached_follower_count = _parse_engagement_number(follower_match.group(1))
-                                        break
-                            except:
-                                continue
-                    except:
-                        pass
-                
-                # Method 3: Look for data-testid attributes
-                if cached_follower_count is None:
-                    try:
-                        follower_elems = await new_page.query_selector_all('[data-testid*="follower"], [data-testid*="Follower"]')
-                        for elem in follower_elems:
-                            try:
-                                text = await elem.inner_text()
-                                aria_label = await elem.get_attribute('aria-label') or ''
-                                combined = f"{text} {aria_label}"
-                                follower_match = re.search(r'([\d,.]+[KMBkmb]?)\s*followers?', combined, re.IGNORECASE)
-                                if follower_match:
-                                    cached_follower_count = _parse_engagement_number(follower_match.group(1))
-                                    break
-                            except:
-                                continue
-                    except:
-                        pass
-                
-                # Method 4: Use JavaScript to find follower count in the page
-                if cached_follower_count is None:
-                    try:
-                        follower_count_js = await new_page.evaluate("""
-                            () => {
-                                // Look for links with /followers
-                                const followerLinks = Array.from(document.querySelectorAll('a[href*="/followers"]'));
-                                for (const link of followerLinks) {
-                                    const text = link.innerText || link.textContent || '';
-                                    const match = text.match(/([\\d,.]+[KMBkmb]?)\\s*followers?/i);
-                                    if (match) return match[1];
-                                }
-                                
-                                // Look in all spans
-                                const spans = Array.from(document.querySelectorAll('span'));
-                                for (const span of spans) {
-                                    const text = span.innerText || span.textContent || '';
-                                    if (text.toLowerCase().includes('followers') && !text.toLowerCase().includes('following')) {
-                                        const match = text.match(/([\\d,.]+[KMBkmb]?)\\s*followers?/i);
-                                        if (match) return match[1];
-                                    }
-                                }
-                                
-                                // Search all text
-                                const bodyText = document.body.innerText || document.body.textContent || '';
-                                const matches = bodyText.match(/([\\d,.]+[KMBkmb]?)\\s*followers?/gi);
-                                if (matches && matches.length > 0) {
-                                    return matches[0].replace(/\\s*followers?/gi, '').trim();
-                                }
-                                
-                                return null;
-                            }
-                        """)
-                        if follower_count_js:
-                            cached_follower_count = _parse_engagement_number(follower_count_js)
-                    except:
-                        pass
-                
-                if cached_follower_count:
-                    account_followers_fetched = True
-                    print(f"Cached follower count for @{account_name}: {cached_follower_count}")
-                else:
-                    print(f"Warning: Could not fetch follower count for @{account_name}, will skip for all tweets")
-                    account_followers_fetched = True  # Mark as fetched even if failed to avoid retrying
-                
-                await new_page.close()
-                
-            except Exception as e:
-                print(f"Error fetching follower count: {e}")
-                account_followers_fetched = True  # Mark as fetched to avoid retrying
-                try:
-                    await new_page.close()
-                except:
-                    pass
-        except Exception as e:
-            print(f"Error setting up follower count fetch: {e}")
-            account_followers_fetched = True  # Mark as fetched to avoid retrying
+        cached_follower_count = await _fetch_follower_count(page.context, account_name, follower_pages)
+        if cached_follower_count:
+            print(f"Cached follower count for @{account_name}: {cached_follower_count}")
+        else:
+            print(f"Warning: Could not fetch follower count for @{account_name}, will skip for all tweets")
+    
+    # Target account in lowercase, compared against the author of every tweet in account searches
+    target_account = from_account.lstrip('@').lower() if from_account else None
     
     # Parse date filters for comparison
     since_date_obj = None
@@ -706,531 +1182,371 @@ async def _perform_search_and_scrape(
             until_date_obj = datetime.strptime(until_date, '%Y-%m-%d')
         except:
             pass
+    since_day = since_date_obj.date() if since_date_obj else None
+    until_day = until_date_obj.date() if until_date_obj else None
+    
+    current_tweet_ids = set() # Tweets found in the current scroll window, cleared every scroll
 
-    while (limit is None or collected_count < limit) and scroll_attempts_without_new_tweets < MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_TWEETS and tweets_outside_date_range < MAX_TWEETS_OUTSIDE_RANGE:
-        # Check if we're still on the search results page (not navigated to individual posts)
-        current_url = page.url
-        if '/search' not in current_url:
-            print(f"WARNING: Navigated away from search page to: {current_url}")
-            print("Navigating back to search results...")
-            await page.goto(search_url, timeout=30000, wait_until='domcontentloaded')
-            await asyncio.sleep(1.5)  # Wait for page to reload
-            # Re-wait for articles to load
+    try:
+        while (limit is None or collected_count < limit) and scroll_attempts_without_new_tweets < MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_TWEETS and tweets_outside_date_range < MAX_TWEETS_OUTSIDE_RANGE:
+            # Check if we're still on the search results page (not navigated to individual posts)
+            current_url = page.url
+            if '/search' not in current_url:
+                print(f"WARNING: Navigated away from search page to: {current_url}")
+                print("Navigating back to search results...")
+                await page.goto(search_url, timeout=30000, wait_until='domcontentloaded')
+                await asyncio.sleep(1.5)  # Wait for page to reload
+                # Re-wait for articles to load
+                try:
+                    await page.wait_for_selector('article', timeout=10000)
+                except:
+                    pass
+                continue  # Skip this iteration and try again
+        
+            # Only fetch articles not visited in an earlier scroll (visited ones are marked below),
+            # so each scroll handles the newly loaded tweets instead of the whole timeline
+            tweet_elements = await page.query_selector_all(f'article:not([{SCRAPED_ARTICLE_ATTR}])')
+            # print(f"Found {len(tweet_elements)} article elements on current view.")
+        
+            # Read the status link of every article in one round trip, so already seen
+            # tweets are skipped before any of their other fields are read
             try:
-                await page.wait_for_selector('article', timeout=10000)
-            except:
-                pass
-            continue  # Skip this iteration and try again
+                tweet_urls = await page.evaluate(_TWEET_URLS_JS, tweet_elements)
+            except Exception:
+                tweet_urls = [None] * len(tweet_elements)
         
-        tweet_elements = await page.query_selector_all('article')
-        # print(f"Found {len(tweet_elements)} article elements on current view.")
+            # Then read the fields of all unseen articles in one more round trip
+            tweet_fields = [None] * len(tweet_elements)
+            unseen_indexes = [
+                i for i, tweet_url in enumerate(tweet_urls)
+                if tweet_url and tweet_url.split('/')[-1] not in seen_tweet_ids
+            ]
+            if unseen_indexes:
+                try:
+                    unseen_fields = await page.evaluate(
+                        _EXTRACT_TWEETS_FIELDS_JS, [tweet_elements[i] for i in unseen_indexes]
+                    )
+                    for i, fields in zip(unseen_indexes, unseen_fields):
+                        tweet_fields[i] = fields
+                except Exception:
+                    pass # Fall back to reading each article on its own below
 
-        newly_collected_in_scroll = 0  # Counter for tweets actually collected and saved in this scroll
-        current_tweet_ids = set() # To track tweets found in the current scroll window
+            newly_collected_in_scroll = 0  # Counter for tweets actually collected and saved in this scroll
+            current_tweet_ids.clear()
+            visited_elements = [] # Articles whose tweet ID was read in this scroll
 
-        for tweet_element in tweet_elements:
-            if limit is not None and collected_count >= limit:
-                break
+            for tweet_element, tweet_url, fields in zip(tweet_elements, tweet_urls, tweet_fields):
+                if limit is not None and collected_count >= limit:
+                    break
 
-            try:
-                tweet_link_element = await tweet_element.query_selector("a[href*='/status/']")
-                tweet_url = await tweet_link_element.get_attribute('href') if tweet_link_element else None
-                tweet_id = tweet_url.split('/')[-1] if tweet_url else None
-                tweet_link = f"https://x.com{tweet_url}" if tweet_url else None
+                try:
+                    tweet_id = tweet_url.split('/')[-1] if tweet_url else None
+                    tweet_link = f"https://x.com{tweet_url}" if tweet_url else None
 
-                if tweet_id:
-                     current_tweet_ids.add(tweet_id) # Add to set of tweets seen in this scroll window
+                    if tweet_id:
+                         current_tweet_ids.add(tweet_id) # Add to set of tweets seen in this scroll window
+                         visited_elements.append(tweet_element)
 
-                # Only process if we have a valid, unseen tweet ID
-                if tweet_id and tweet_id not in seen_tweet_ids:
+                    # Only process if we have a valid, unseen tweet ID
+                    if tweet_id and tweet_id not in seen_tweet_ids:
 
-                    # *** Handle 'Show more' button before text extraction ***
-                    # Skip clicking "Show more" to avoid potential navigation - just extract what's visible
-                    # If text is truncated, we'll get what's available without expanding
-                    pass
+                        # *** Handle 'Show more' button before text extraction ***
+                        # Skip clicking "Show more" to avoid potential navigation - just extract what's visible
+                        # If text is truncated, we'll get what's available without expanding
+                        pass
+
+                        if fields is None:
+                            fields = await tweet_element.evaluate(_EXTRACT_TWEET_FIELDS_JS)
+
+                        # *** Extract Tweet Text (after potential expansion) ***
+                        raw_text = fields['text'] if fields['text'] is not None else "Could not retrieve tweet text."
 
-                    # *** Extract Tweet Text (after potential expansion) ***
-                    text_element = await tweet_element.query_selector('[data-testid="tweetText"]')
-                    raw_text = await text_element.inner_text() if text_element else "Could not retrieve tweet text."
-
-                    # *** Extract Username ***
-                    username = None
-                    username_link_element = await tweet_element.query_selector('a[role="link"][href^="/"]')
-                    if username_link_element:
-                         href = await username_link_element.get_attribute('href')
-                         if href and href.startswith('/'):
-                              username = href.lstrip('/')
+                        # *** Extract Username ***
+                        # The User-Name container holds the display name followed by the @handle
+                        user_name_lines = fields['user_names'].strip().split('\n') if fields['user_names'] else []
+                        username = next((line[1:].strip() for line in user_name_lines if line.startswith('@')), None)
+                        if not username:
+                            # Fall back to the first profile link in the tweet
+                            href = fields['username_href']
+                            if href and href.startswith('/'):
+                                 username = href.lstrip('/')
                     
-                    # For account-based searches, skip tweets that are not from the target account
-                    # This prevents scraping replies and thread content
-                    if from_account:
-                        account_name = from_account.lstrip('@').lower()
-                        if username and username.lower() != account_name:
+                        # For account-based searches, skip tweets that are not from the target account
+                        # This prevents scraping replies and thread content
+                        if target_account and username and username.lower() != target_account:
                             # Skip this tweet - it's not from the target account (likely a reply or thread content)
                             continue
 
-                    # *** Extract Display Name ***
-                    display_name = None
-                    user_names_container = await tweet_element.query_selector('[data-testid="User-Name"]')
-                    if user_names_container:
-                         full_names_text = await user_names_container.inner_text()
-                         if full_names_text:
-                             display_name_candidates = full_names_text.strip().split('\n')
-                             if display_name_candidates:
-                                 display_name = display_name_candidates[0].strip()
-                                 if username and display_name.endswith(f' @{username}'):
-                                     display_name = display_name[:-len(f' @{username}')].strip()
-                                 elif username and display_name.endswith(username):
-                                      display_name = display_name[:-len(username)].strip()
-
-                    # *** Extract Tweet Images ***
-                    image_elements = await tweet_element.query_selector_all('img[src^="https://pbs.twimg.com/"]')
-                    image_urls = [await img.get_attribute('src') for img in image_elements if await img.get_attribute('src')]
-
-                    # *** Extract Tweet Date ***
-                    date_element = await tweet_element.query_selector('time')
-                    tweet_date_str = None
-                    if date_element:
-                        datetime_attr = await date_element.get_attribute('datetime')
-                        if datetime_attr:
-                            try:
-                                dt_object = datetime.fromisoformat(datetime_attr.replace('Z', '+00:00'))
-                                tweet_date_str = dt_object.isoformat()
-                            except ValueError:
-                                pass # Continue to inner text parsing
+                        # *** Extract Tweet Date ***
+                        date_element = fields['time']
+                        tweet_date_str = None
+                        if date_element:
+                            datetime_attr = date_element['datetime']
+                            if datetime_attr:
+                                try:
+                                    dt_object = datetime.fromisoformat(datetime_attr.replace('Z', '+00:00'))
+                                    tweet_date_str = dt_object.isoformat()
+                                except ValueError:
+                                    pass # Continue to inner text parsing
+
+                            if tweet_date_str is None:
+                                inner_text = date_element['text']
+                                if inner_text:
+                                    cleaned_text = inner_text.strip()
+                                    tweet_date_str = _parse_tweet_date_text(cleaned_text)
 
                         if tweet_date_str is None:
-                            inner_text = await date_element.inner_text()
-                            if inner_text:
-                                cleaned_text = inner_text.strip()
-                                date_match = re.search(
-                                    r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}(?:,\s+\d{4})?'
-                                    r'|\d{4}/\d{2}/\d{2}'
-                                    r'|\d{2}/\d{2}/\d{4}'
-                                    r'|\d{1,2}:\d{2}\s*(?:AM|PM)?',
-                                    cleaned_text
-                                )
-
-                                if date_match:
-                                    date_part = date_match.group(0).strip()
-                                    date_formats = [
-                                        '%b %d',      # e.g., May 20
-                                        '%b %d, %Y',  # e.g., May 20, 2023
-                                        '%H:%M %p',   # e.g., 10:30 AM
-                                        '%I:%M %p',   # e.g., 10:30 AM
-                                        '%Y/%m/%d', # e.g., 2023/12/31
-                                        '%m/%d/%Y', # e.g., 12/31/2023
-                                        '%H:%M',
-                                        '%I:%M',
-                                    ]
-                                    current_year = datetime.now().year
-                                    parsed_date = None
-                                    for fmt in date_formats:
-                                        try:
-                                            if '%b %d' in fmt and re.match(r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2}', date_part):
-                                                dt_obj = datetime.strptime(f'{date_part} {current_year}', f'{fmt} %Y')
-                                                parsed_date = dt_obj
-                                                break
-                                            elif '%H' in fmt or '%I' in fmt:
-                                                 dt_obj = datetime.strptime(date_part, fmt).replace(year=datetime.now().year, month=datetime.now().month, day=datetime.now().day)
-                                                 parsed_date = dt_obj
-                                                 break
-                                            else:
-                                                 dt_obj = datetime.strptime(date_part, fmt)
-                                                 parsed_date = dt_obj
-                                                 break
-                                        except ValueError:
-                                            pass
-
-                                    if parsed_date:
-                                        tweet_date_str = parsed_date.isoformat()
-                                    else:
-                                         tweet_date_str = date_part
+                             tweet_date_str = "Date not found"
+                    
+                        # *** Check if tweet is outside date range (for latest mode filtering) ***
+                        tweet_date_obj = None
+                        is_outside_range = False
+                        if tweet_date_str and tweet_date_str != "Date not found":
+                            try:
+                                # Try to parse the date string
+                                if 'T' in tweet_date_str or '+' in tweet_date_str:
+                                    # ISO format - only the local date and time part is needed
+                                    tweet_date_obj = datetime.fromisoformat(tweet_date_str[:19])
                                 else:
-                                     tweet_date_str = cleaned_text
+                                    # Try other formats
+                                    for fmt in _TWEET_DATE_FORMATS:
+                                        try:
+                                            tweet_date_obj = datetime.strptime(tweet_date_str, fmt)
+                                            break
+                                        except:
+                                            continue
+                            
+                                # Check if tweet is outside date range
+                                if tweet_date_obj:
+                                    tweet_day = tweet_date_obj.date()
+                                    if since_day and tweet_day < since_day:
+                                        is_outside_range = True
+                                    if until_day and tweet_day > until_day:
+                                        is_outside_range = True
+                            except:
+                                pass  # If date parsing fails, continue anyway
+
+                        # Skip tweets outside the date range before reading anything else from them
+                        if is_outside_range and (since_date_obj is not None or until_date_obj is not None):
+                            tweets_outside_date_range += 1
+                            # In latest mode or when date filtering is active, if we've scrolled past since_date, stop immediately
+                            if since_day and tweet_date_obj and tweet_date_obj.date() < since_day:
+                                print(f"Reached tweets older than {since_date}. Stopping scroll.")
+                                break
+                            # Stop immediately when we find tweets outside the date range (for latest mode)
+                            if latest and is_outside_range:
+                                print(f"Found tweet outside date range ({tweet_date_obj.date() if tweet_date_obj else 'unknown'}). Stopping scroll.")
+                                break
+                            # Also stop if we see too many consecutive tweets outside range (for non-latest mode)
+                            if not latest and tweets_outside_date_range >= MAX_TWEETS_OUTSIDE_RANGE:
+                                print(f"Stopping: Found {tweets_outside_date_range} consecutive tweets outside date range.")
+                                break
+                            continue
+                    
+                        # Reset counter if we found a tweet in range
+                        tweets_outside_date_range = 0
+
+                        # *** Extract Display Name ***
+                        display_name = None
+                        if user_name_lines:
+                             display_name = user_name_lines[0].strip()
+                             if username and display_name.endswith(f' @{username}'):
+                                 display_name = display_name[:-len(f' @{username}')].strip()
+                             elif username and display_name.endswith(username):
+                                  display_name = display_name[:-len(username)].strip()
 
-                    if tweet_date_str is None:
-                         tweet_date_str = "Date not found"
+                        # *** Extract Tweet Images ***
+                        image_urls = fields['images']
+
+                        # *** Extract Engagement Metrics (Views, Replies, Reposts, Likes) ***
+                        views = None
+                        replies = None
+                        reposts = None
+                        likes = None
                     
-                    # *** Check if tweet is outside date range (for latest mode filtering) ***
-                    tweet_date_obj = None
-                    is_outside_range = False
-                    if tweet_date_str and tweet_date_str != "Date not found":
+                        # Try to find engagement buttons/links using multiple methods
                         try:
-                            # Try to parse the date string
-                            if 'T' in tweet_date_str or '+' in tweet_date_str:
-                                # ISO format
-                                tweet_date_obj = datetime.fromisoformat(tweet_date_str.replace('Z', '+00:00').split('+')[0])
-                            else:
-                                # Try other formats
-                                for fmt in ['%Y-%m-%d', '%b %d, %Y', '%Y/%m/%d', '%m/%d/%Y']:
-                                    try:
-                                        tweet_date_obj = datetime.strptime(tweet_date_str.split('T')[0], fmt)
-                                        break
-                                    except:
-                                        continue
-                            
-                            # Check if tweet is outside date range
-                            if tweet_date_obj:
-                                if since_date_obj and tweet_date_obj.date() < since_date_obj.date():
-                                    is_outside_range = True
-                                if until_date_obj and tweet_date_obj.date() > until_date_obj.date():
-                                    is_outside_range = True
-                        except:
-                            pass  # If date parsing fails, continue anyway
-
-                    # *** Extract Engagement Metrics (Views, Replies, Reposts, Likes) ***
-                    views = None
-                    replies = None
-                    reposts = None
-                    likes = None
-                    
-                    # Try to find engagement buttons/links using multiple methods
-                    try:
-                        # Method 1: Look for aria-label attributes (most reliable)
-                        engagement_elements = await tweet_element.query_selector_all('[aria-label]')
-                        for elem in engagement_elements:
-                            aria_label = await elem.get_attribute('aria-label')
-                            if aria_label:
-                                aria_lower = aria_label.lower()
-                                # Extract numbers from aria-label like "1,234 replies" or "10.5K likes"
-                                if 'reply' in aria_lower or 'replied' in aria_lower:
-                                    num_match = re.search(r'([\d,.]+[KMBkmb]?)\s*(?:replies?|replied)', aria_lower, re.IGNORECASE)
-                                    if num_match and replies is None:
-                                        replies = _parse_engagement_number(num_match.group(1))
-                                elif 'repost' in aria_lower or 'retweet' in aria_lower:
-                                    num_match = re.search(r'([\d,.]+[KMBkmb]?)\s*(?:reposts?|retweets?)', aria_lower, re.IGNORECASE)
-                                    if num_match and reposts is None:
-                                        reposts = _parse_engagement_number(num_match.group(1))
-                                elif 'like' in aria_lower or 'liked' in aria_lower:
-                                    num_match = re.search(r'([\d,.]+[KMBkmb]?)\s*(?:likes?|liked)', aria_lower, re.IGNORECASE)
-                                    if num_match and likes is None:
-                                        likes = _parse_engagement_number(num_match.group(1))
-                                elif 'view' in aria_lower:
-                                    num_match = re.search(r'([\d,.]+[KMBkmb]?)\s*views?', aria_lower, re.IGNORECASE)
-                                    if num_match and views is None:
+                            # Method 1: Look for aria-label attributes (most reliable)
+                            for aria_label in fields['aria_labels']:
+                                # Extract every number in the label like "1,234 replies" or "10.5K likes"
+                                # in one pass, so combined labels fill several metrics at once
+                                for num_match in _ENGAGEMENT_LABEL_RE.finditer(aria_label):
+                                    kind = num_match.group('kind')[:4].lower()
+                                    if kind == 'repl':
+                                        if replies is None:
+                                            replies = _parse_engagement_number(num_match.group(1))
+                                    elif kind in {'repo', 'retw'}:
+                                        if reposts is None:
+                                            reposts = _parse_engagement_number(num_match.group(1))
+                                    elif kind == 'like':
+                                        if likes is None:
+                                            likes = _parse_engagement_number(num_match.group(1))
+                                    elif views is None:
                                         views = _parse_engagement_number(num_match.group(1))
+                            
+                                # Stop once all four metrics are known; the remaining labels
+                                # belong to avatars, badges and the like
+                                if None not in (replies, reposts, likes, views):
+                                    break
                         
-                        # Method 2: Look for data-testid buttons and get their text
-                        if replies is None:
-                            reply_element = await tweet_element.query_selector('[data-testid="reply"]')
-                            if reply_element:
-                                reply_text = await reply_element.inner_text()
-                                replies = _parse_engagement_number(reply_text)
+                            # Method 2: Look for data-testid buttons and get their text
+                            if replies is None and fields['reply_text'] is not None:
+                                replies = _parse_engagement_number(fields['reply_text'])
                         
-                        if reposts is None:
-                            retweet_element = await tweet_element.query_selector('[data-testid="retweet"]')
-                            if retweet_element:
-                                retweet_text = await retweet_element.inner_text()
-                                reposts = _parse_engagement_number(retweet_text)
+                            if reposts is None and fields['retweet_text'] is not None:
+                                reposts = _parse_engagement_number(fields['retweet_text'])
                         
-                        if likes is None:
-                            like_element = await tweet_element.query_selector('[data-testid="like"]')
-                            if like_element:
-                                like_text = await like_element.inner_text()
-                                likes = _parse_engagement_number(like_text)
+                            if likes is None and fields['like_text'] is not None:
+                                likes = _parse_engagement_number(fields['like_text'])
                         
-                        # Method 3: Look for views in text content (views might be displayed differently)
-                        if views is None:
-                            # Look for elements containing "views" text
-                            all_text_elements = await tweet_element.query_selector_all('span, div, a')
-                            for elem in all_text_elements:
-                                text = await elem.inner_text()
-                                if text:
-                                    view_match = re.search(r'([\d,.]+[KMBkmb]?)\s*views?', text, re.IGNORECASE)
-                                    if view_match:
-                                        views = _parse_engagement_number(view_match.group(1))
-                                        break
-                    except Exception as e:
-                        # print(f"Error extracting engagement metrics: {e}")
-                        pass
-                    
-                    # *** Extract Profile Followers ***
-                    # For account-based searches, use cached value. For keyword searches, fetch for each unique account.
-                    profile_followers = None
-                    
-                    # If doing account-based search, use cached value (fetched before loop)
-                    if from_account and account_followers_fetched:
-                        profile_followers = cached_follower_count
-                    elif not from_account and username:
-                        # For keyword-based search, check cache first, then fetch if not cached
-                        if username in follower_count_cache:
-                            profile_followers = follower_count_cache[username]
-                        else:
-                            # Fetch follower count for this unique account
-                            try:
-                                context = page.context
-                                profile_url = f"https://x.com/{username}"
-                                new_page = await context.new_page()
-                                
-                                try:
-                                    await new_page.goto(profile_url, timeout=30000, wait_until='domcontentloaded')
-                                    await asyncio.sleep(0.5)  # Short wait for page to load
-                                    
-                                    # Wait for follower link to appear
-                                    try:
-                                        await new_page.wait_for_selector('a[href*="/followers"]', timeout=2000)
-                                    except:
-                                        pass
-                                    
-                                    # Method 1: Look for link with /followers in href
-                                    try:
-                                        follower_links = await new_page.query_selector_all('a[href*="/followers"]')
-                                        for follower_link in follower_links:
-                                            try:
-                                                link_text = await follower_link.inner_text()
-                                                follower_match = re.search(r'([\d,.]+[KMBkmb]?)\s*followers?', link_text, re.IGNORECASE)
-                                                if follower_match:
-                                                    profile_followers = _parse_engagement_number(follower_match.group(1))
-                                                    break
-                                            except:
-                                                continue
-                                    except:
-                                        pass
-                                    
-                                    # Method 2: Look for span elements
-                                    if profile_followers is None:
-                                        try:
-                                            all_spans = await new_page.query_selector_all('span')
-                                            for span in all_spans:
-                                                try:
-                                                    text = await span.inner_text()
-                                                    if 'followers' in text.lower() and 'following' not in text.lower():
-                                                        follower_match = re.search(r'([\d,.]+[KMBkmb]?)\s*followers?', text, re.IGNORECASE)
-                                                        if follower_match:
-                                                            profile_followers = _parse_engagement_number(follower_match.group(1))
-                                                            break
-                                                except:
-                                                    continue
-                                        except:
-                                            pass
-                                    
-                                    # Method 3: Use JavaScript extraction
-                                    if profile_followers is None:
-                                        try:
-                                            follower_count_js = await new_page.evaluate("""
-                                                () => {
-                                                    const followerLinks = Array.from(document.querySelectorAll('a[href*="/followers"]'));
-                                                    for (const link of followerLinks) {
-                                                        const text = link.innerText || link.textContent || '';
-                                                        const match = text.match(/([\\d,.]+[KMBkmb]?)\\s*followers?/i);
-                                                        if (match) return match[1];
-                                                    }
-                                                    const bodyText = document.body.innerText || '';
-                                                    const matches = bodyText.match(/([\\d,.]+[KMBkmb]?)\\s*followers?/gi);
-                                                    if (matches && matches.length > 0) {
-                                                        return matches[0].replace(/\\s*followers?/gi, '').trim();
-                                                    }
-                                                    return null;
-                                                }
-                                            """)
-                                            if follower_count_js:
-                                                profile_followers = _parse_engagement_number(follower_count_js)
-                                        except:
-                                            pass
-                                    
-                                    # Cache the follower count for this username
-                                    if profile_followers:
-                                        follower_count_cache[username] = profile_followers
-                                    
-                                    await new_page.close()
-                                    
-                                except Exception as profile_error:
-                                    try:
-                                        await new_page.close()
-                                    except:
-                                        pass
-                                    
-                            except Exception as e:
-                                pass
-
-                    # *** Add collected tweet and update counts ONLY for unique tweets ***
-                    tweet_info = {
-                        'id': tweet_id,
-                        'views': views or "N/A",
-                        'replies': replies or "N/A",
-                        'reposts': reposts or "N/A",
-                        'likes': likes or "N/A",
-                        'body': raw_text,
-                        'url': tweet_link,
-                        'date': tweet_date_str,
-                        'author': username or display_name or "N/A",
-                        'profile_followers': profile_followers or "N/A",
-                        # Keep old fields for backward compatibility
-                        'link': tweet_link,
-                        'username': username,
-                        'display_name': display_name,
-                        'text': raw_text,
-                        'images': image_urls,
-                    }
-
-                    # Check if tweet should be added (within date range or no date filtering)
-                    should_add_tweet = True
-                    if is_outside_range and (since_date_obj is not None or until_date_obj is not None):
-                        should_add_tweet = False
-                        tweets_outside_date_range += 1
-                        # In latest mode or when date filtering is active, if we've scrolled past since_date, stop immediately
-                        if since_date_obj and tweet_date_obj and tweet_date_obj.date() < since_date_obj.date():
-                            print(f"Reached tweets older than {since_date}. Stopping scroll.")
-                            break
-                        # Stop immediately when we find tweets outside the date range (for latest mode)
-                        if latest and is_outside_range:
-                            print(f"Found tweet outside date range ({tweet_date_obj.date() if tweet_date_obj else 'unknown'}). Stopping scroll.")
-                            break
-                        # Also stop if we see too many consecutive tweets outside range (for non-latest mode)
-                        if not latest and tweets_outside_date_range >= MAX_TWEETS_OUTSIDE_RANGE:
-                            print(f"Stopping: Found {tweets_outside_date_range} consecutive tweets outside date range.")
-                            break
-                    else:
-                        # Reset counter if we found a tweet in range
-                        tweets_outside_date_range = 0
+                            # Method 3: Look for views in text content (views might be displayed differently)
+                            if views is None and fields['views_text']:
+                                views = _parse_engagement_number(fields['views_text'])
+                        except Exception as e:
+                            # print(f"Error extracting engagement metrics: {e}")
+                            pass
                     
-                    if should_add_tweet:
-                        all_collected_tweets.append(tweet_info)
+                        # *** Add collected tweet and update counts ONLY for unique tweets ***
+                        tweet_info = {
+                            'id': tweet_id,
+                            'views': views or "N/A",
+                            'replies': replies or "N/A",
+                            'reposts': reposts or "N/A",
+                            'likes': likes or "N/A",
+                            'body': raw_text,
+                            'url': tweet_link,
+                            'date': tweet_date_str,
+                            'author': username or display_name or "N/A",
+                            'profile_followers': (cached_follower_count if from_account else None) or "N/A",
+                            # Keep old fields for backward compatibility
+                            'link': tweet_link,
+                            'username': username,
+                            'display_name': display_name,
+                            'text': raw_text,
+                            'images': image_urls,
+                        }
+
+                        # For keyword searches, start the author's follower lookup now (once per
+                        # username); the tweet is saved once the lookup has finished
+                        follower_task = None
+                        if fetch_followers and not from_account and username:
+                            follower_task = follower_tasks.get(username)
+                            if follower_task is None:
+                                follower_task = asyncio.ensure_future(fetch_followers_limited(username))
+                                follower_tasks[username] = follower_task
+                        unsaved_tweets.append((tweet_info, follower_task))
                         seen_tweet_ids.add(tweet_id)
                         newly_collected_in_scroll += 1
                         collected_count += 1
-                        
-                        # Save tweet incrementally to file
-                        save_tweet_incremental(tweet_info)
-                        
-                        # Check URL after saving each tweet to catch navigation
-                        check_url = page.url
-                        if '/search' not in check_url:
-                            print(f"WARNING: Navigated away during extraction to: {check_url}")
-                            print("Navigating back to search results...")
-                            await page.goto(search_url, timeout=30000, wait_until='domcontentloaded')
-                            await asyncio.sleep(1.5)
-                            try:
-                                await page.wait_for_selector('article', timeout=10000)
-                            except:
-                                pass
-                            break  # Break out of tweet loop and restart
-
-                    # Print collected tweet information to the console in a user-friendly format
-                    if app_instance is None: # Only print in CLI mode
-                        print("--------------------")
-                        print(f"ID: {tweet_info.get('id', 'N/A')}")
-                        print(f"Views: {tweet_info.get('views', 'N/A')}")
-                        print(f"Replies: {tweet_info.get('replies', 'N/A')}")
-                        print(f"Reposts: {tweet_info.get('reposts', 'N/A')}")
-                        print(f"Likes: {tweet_info.get('likes', 'N/A')}")
-                        print(f"Author: {tweet_info.get('author', 'N/A')}")
-                        print(f"Profile Followers: {tweet_info.get('profile_followers', 'N/A')}")
-                        print(f"Date: {tweet_info.get('date', 'N/A')}")
-                        print(f"URL: {tweet_info.get('url', 'N/A')}")
-                        print(f"Body:\n{tweet_info.get('body', 'Could not retrieve text.')}")
-                        if tweet_info.get('images'):
-                            print(f"Images: {', '.join(tweet_info.get('images'))}")
-                        print("--------------------")
-
-            except Exception as e:
-                # print(f"Error during tweet data extraction for an article element: {e}") # Optional: uncomment for debugging extraction issues
-                pass # Continue to the next element
-
-        # Update the global set of seen tweet IDs with the ones found in this scroll window
-        seen_tweet_ids.update(current_tweet_ids)
-
-        # Check if we actually collected any new tweets in this scroll
-        # newly_collected_in_scroll is incremented when we save a tweet (line 892)
-        if newly_collected_in_scroll == 0:
-             scroll_attempts_without_new_tweets += 1
-             print(f"No new unique tweets collected in this scroll. Attempts without new tweets: {scroll_attempts_without_new_tweets}")
-             # Stop immediately if we've tried multiple times without finding new tweets
-             if scroll_attempts_without_new_tweets >= MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_TWEETS:
-                 print(f"Stopping: No new tweets found after {MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_TWEETS} scrolls.")
-                 break
-        else:
-             scroll_attempts_without_new_tweets = 0 # Reset counter if new tweets are found
-             print(f"Collected {newly_collected_in_scroll} new unique tweets in this scroll. Total collected: {len(seen_tweet_ids)}")
+
+                except Exception as e:
+                    # print(f"Error during tweet data extraction for an article element: {e}") # Optional: uncomment for debugging extraction issues
+                    pass # Continue to the next element
+
+            # Save the tweets whose follower counts are known, in order. The rest wait for a later
+            # scroll, so their profile lookups keep running while the page scrolls instead of
+            # holding up the loop
+            ready_count = 0
+            while ready_count < len(unsaved_tweets) and (
+                unsaved_tweets[ready_count][1] is None or unsaved_tweets[ready_count][1].done()
+            ):
+                ready_count += 1
+            if ready_count:
+                await save_collected_tweets(unsaved_tweets[:ready_count])
+                del unsaved_tweets[:ready_count]
+
+            # Update the global set of seen tweet IDs with the ones found in this scroll window
+            seen_tweet_ids.update(current_tweet_ids)
+        
+            # Mark this scroll's visited articles in one call so the next scroll skips them
+            if visited_elements:
+                try:
+                    await page.evaluate(
+                        f"(articles) => articles.forEach(article => article.setAttribute('{SCRAPED_ARTICLE_ATTR}', ''))",
+                        visited_elements
+                    )
+                except Exception:
+                    pass # Unmarked articles are still skipped by the seen_tweet_ids check
+
+            # Check if we actually collected any new tweets in this scroll
+            # newly_collected_in_scroll is incremented when we save a tweet (line 892)
+            if newly_collected_in_scroll == 0:
+                 scroll_attempts_without_new_tweets += 1
+                 print(f"No new unique tweets collected in this scroll. Attempts without new tweets: {scroll_attempts_without_new_tweets}")
+                 # Stop immediately if we've tried multiple times without finding new tweets
+                 if scroll_attempts_without_new_tweets >= MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_TWEETS:
+                     print(f"Stopping: No new tweets found after {MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_TWEETS} scrolls.")
+                     break
+            else:
+                 scroll_attempts_without_new_tweets = 0 # Reset counter if new tweets are found
+                 print(f"Collected {newly_collected_in_scroll} new unique tweets in this scroll. Total collected: {len(seen_tweet_ids)}")
         
-        # Check if we should stop due to date range
-        if tweets_outside_date_range >= MAX_TWEETS_OUTSIDE_RANGE:
-            print(f"Stopping: Found {tweets_outside_date_range} consecutive tweets outside date range.")
-            break
-
-
-        if limit is not None and collected_count >= limit:
-             break
-
-        # Check URL before scrolling to ensure we're still on search page
-        current_url_before_scroll = page.url
-        if '/search' not in current_url_before_scroll:
-            print(f"WARNING: Not on search page before scroll: {current_url_before_scroll}")
-            print("Navigating back to search results...")
-            await page.goto(search_url, timeout=30000, wait_until='domcontentloaded')
-            await asyncio.sleep(1.0)
-            continue
+            # Check if we should stop due to date range
+            if tweets_outside_date_range >= MAX_TWEETS_OUTSIDE_RANGE:
+                print(f"Stopping: Found {tweets_outside_date_range} consecutive tweets outside date range.")
+                break
+
+
+            if limit is not None and collected_count >= limit:
+                 break
+
+            # Check URL before scrolling to ensure we're still on search page
+            current_url_before_scroll = page.url
+            if '/search' not in current_url_before_scroll:
+                print(f"WARNING: Not on search page before scroll: {current_url_before_scroll}")
+                print("Navigating back to search results...")
+                await page.goto(search_url, timeout=30000, wait_until='domcontentloaded')
+                await asyncio.sleep(1.0)
+                continue
         
-        # Scroll down
-        # print("Scrolling down...") # Optional debug print
-        await page.evaluate("window.scrollBy(0, window.innerHeight)")
-        await asyncio.sleep(random.uniform(1,2)) # Reduced wait after scroll
+            # Scroll down
+            # print("Scrolling down...") # Optional debug print
+            # Wait only until the new tweets arrive instead of a fixed pause; on a timeout
+            # the height check below counts the scroll as one without new content
+            try:
+                new_height = await page.evaluate(_SCROLL_AND_WAIT_JS, [last_height, SCROLL_LOAD_TIMEOUT])
+            except Exception:
+                new_height = last_height # e.g. the page navigated away mid-scroll
+            await random_sleep_async(0.15, 0.35) # Let the new tweets finish rendering
         
-        # Check URL after scrolling to catch any navigation
-        current_url_after_scroll = page.url
-        if '/search' not in current_url_after_scroll:
-            print(f"WARNING: Navigated away from search page after scroll to: {current_url_after_scroll}")
-            print("Navigating back to search results...")
-            await page.goto(search_url, timeout=30000, wait_until='domcontentloaded')
-            await asyncio.sleep(1.0)
-            continue
-
-        new_height = await page.evaluate("document.body.scrollHeight")
-        if new_height == last_height:
-             print("Reached end of search results or no new tweets loaded after scrolling.")
-             scroll_attempts_without_new_tweets += 1 # Increment even if height didn't change
-             if scroll_attempts_without_new_tweets >= MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_TWEETS:
-                  print(f"Stopping after {MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_TWEETS} scrolls without new content.")
-                  break
-        else:
-             last_height = new_height # Update last_height for the next loop iteration
-             # Only reset counter if we actually found NEW tweets, not just because height increased
-             # (Height can increase due to ads, suggestions, etc. without new tweets)
-             # The counter is already managed above based on newly_collected_in_scroll
+            # Check URL after scrolling to catch any navigation
+            current_url_after_scroll = page.url
+            if '/search' not in current_url_after_scroll:
+                print(f"WARNING: Navigated away from search page after scroll to: {current_url_after_scroll}")
+                print("Navigating back to search results...")
+                await page.goto(search_url, timeout=30000, wait_until='domcontentloaded')
+                await asyncio.sleep(1.0)
+                continue
 
+            if new_height == last_height:
+                 print("Reached end of search results or no new tweets loaded after scrolling.")
+                 scroll_attempts_without_new_tweets += 1 # Increment even if height didn't change
+                 if scroll_attempts_without_new_tweets >= MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_TWEETS:
+                      print(f"Stopping after {MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_TWEETS} scrolls without new content.")
+                      break
+            else:
+                 last_height = new_height # Update last_height for the next loop iteration
+                 # Only reset counter if we actually found NEW tweets, not just because height increased
+                 # (Height can increase due to ads, suggestions, etc. without new tweets)
+                 # The counter is already managed above based on newly_collected_in_scroll
+
+        # Save the tweets still waiting for follower counts
+        await save_collected_tweets(unsaved_tweets)
+        unsaved_tweets.clear()
+    finally:
+        # On an error or cancel, stop the lookups still running against pages that are
+        # about to be closed, and save the tweets waiting for them with the counts known
+        for follower_task in follower_tasks.values():
+            follower_task.cancel()
+        if unsaved_tweets:
+            for tweet_info, follower_task in unsaved_tweets:
+                if follower_task is not None:
+                    tweet_info['profile_followers'] = _finished_follower_count(follower_task) or "N/A"
+            await save_collected_tweets([(tweet_info, None) for tweet_info, _ in unsaved_tweets])
+    
     total_collected = len(seen_tweet_ids)
     print(f"Finished scraping loop. Total unique tweets collected: {total_collected}")
     if limit and total_collected < limit:
         print(f"Note: Requested {limit} tweets but only {total_collected} were available.")
     
-    # Final save to ensure Excel files are properly written
-    if output_file and is_excel_file(output_file) and all_collected_tweets:
-        print(f"Saving final results to Excel file: {output_file}")
-        save_tweets_to_excel(all_collected_tweets, output_file)
-    
     return list(all_collected_tweets) # Ensure we return the list of collected tweets
-
-
-    async def main_test():
-        print("Running standalone search scraper test...")
-        test_username = "YOUR_TWITTER_USERNAME" # Replace
-        test_password = "YOUR_TWITTER_PASSWORD" # Replace
-        test_email = "YOUR_TWITTER_EMAIL" # Optional, replace if needed
-        test_keyword = "test" # Replace with your test keyword
-        test_since_date = "2023-01-01" # Optional
-        test_until_date = "2023-12-31" # Optional
-        test_limit = 10 # Optional
-
-        if test_username == "YOUR_TWITTER_USERNAME" or test_password == "YOUR_TWITTER_PASSWORD":
-             print("Please replace 'YOUR_TWITTER_USERNAME' and 'YOUR_TWITTER_PASSWORD' with test credentials in __main__ block.")
-        else:
-            collected_tweets = await scrape_search_results(
-                keyword=test_keyword,
-                from_account=None,
-                username=test_username,
-                password=test_password,
-                email=test_email,
-                since_date=test_since_date,
-                until_date=test_until_date,
-                limit=test_limit,
-                latest=False,
-                app_instance=None # Ensure app_instance is None for standalone
-                )
-            print(f"Standalone test finished. Collected {len(collected_tweets)} tweets.")
-            # The tweets would have been printed as they were collected by the new print logic
-            # print(json.dumps(collected_tweets, indent=4)) # Uncomment to see JSON output
-
-    # To run the standalone test, uncomment the following line:
-    # asyncio.run(main_test())
-    print("To run standalone test, uncomment the asyncio.run(main_test()) line in __main__ and replace placeholders.") 
\ No newline at end of file